@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+UI Compiler Driver
+
+Compiles several .ui files in a single Python process by calling the
+pyside6-uic entry point in a loop, so the interpreter and PySide6 are only
+loaded once per batch instead of once per file.
+
+Usage: python -m scripts._uic_driver UI_FILE PY_FILE [UI_FILE PY_FILE ...]
+
+For every file it writes, the driver prints a line starting with
+COMPILED_PREFIX followed by the output path, so the caller learns the
+outcome of each pair from the driver itself.
+"""
+import os
+import sys
+
+# Exit code telling the caller that the driver cannot run in this environment
+DRIVER_UNAVAILABLE = 3
+
+# Stdout prefix of the lines reporting a successfully written output file
+COMPILED_PREFIX = "compiled: "
+
+
+def main(argv):
+    """Compile each (ui_file, py_file) pair given on the command line."""
+    try:
+        from PySide6.scripts.pyside_tool import uic
+    except ImportError as e:
+        print(f"Error: cannot import PySide6 uic entry point: {e}", file=sys.stderr)
+        return DRIVER_UNAVAILABLE
+
+    if not argv or len(argv) % 2:
+        print("Error: expected UI_FILE PY_FILE pairs", file=sys.stderr)
+        return 2
+
+    failures = 0
+    for ui_file, py_file in zip(argv[0::2], argv[1::2]):
+        # Write to a temporary file so a half-written module is never imported
+        tmp_file = py_file + ".tmp"
+        sys.argv = ["pyside6-uic", ui_file, "-o", tmp_file]
+        try:
+            uic()
+            code = 0
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (1 if e.code else 0)
+
+        if code == 0 and os.path.exists(tmp_file):
+            os.replace(tmp_file, py_file)
+            print(f"{COMPILED_PREFIX}{py_file}", flush=True)
+        else:
+            print(f"Error compiling {ui_file} (exit code {code})", file=sys.stderr)
+            if os.path.exists(tmp_file):
+                os.unlink(tmp_file)
+            failures += 1
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
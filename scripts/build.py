@@ -4,6 +4,7 @@ Build script for compiling the NIKKE Arena application with Nuitka.
 Handles resource inclusion and proper packaging.
 """
 import datetime
+import hashlib
 import os
 import subprocess
 import sys
@@ -11,6 +12,56 @@ from pathlib import Path
 from typing import Optional
 
 from scripts.common import PROJECT_ROOT
+from scripts.compile_resources import compile_resources
+
+FINGERPRINT_FILE = ".build_fingerprint"
+
+
+def compute_build_fingerprint(src_dir: Path, cmd: list[str]) -> tuple[str, int]:
+    """
+    Compute a fingerprint of the source tree and the build arguments.
+
+    Each source file contributes its relative path, mtime and size, so the
+    fingerprint changes whenever a file is added, removed or modified.
+
+    Returns:
+        The fingerprint and the newest source file mtime in nanoseconds
+    """
+    fp = hashlib.sha256()
+    newest_mtime_ns = 0
+    for root, dirs, files in os.walk(src_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.endswith((".pyc", ".pyo")):
+                continue
+            path = os.path.join(root, name)
+            st = os.stat(path)
+            rel = os.path.relpath(path, src_dir)
+            fp.update(f"{rel}\0{st.st_mtime_ns}\0{st.st_size}\0".encode())
+            newest_mtime_ns = max(newest_mtime_ns, st.st_mtime_ns)
+    # The report path contains a timestamp, so leave it out of the fingerprint
+    args = [arg for arg in cmd[1:] if not arg.startswith("--report=")]
+    fp.update(repr(sorted(args)).encode())
+    return fp.hexdigest(), newest_mtime_ns
+
+
+def read_build_fingerprint(output_dir: Path) -> Optional[str]:
+    """Read the fingerprint of the last successful build, if any."""
+    try:
+        return (output_dir / FINGERPRINT_FILE).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def write_build_fingerprint(output_dir: Path, fingerprint: str):
+    """Atomically store the fingerprint of a successful build."""
+    fingerprint_path = output_dir / FINGERPRINT_FILE
+    tmp_path = fingerprint_path.with_name(fingerprint_path.name + ".tmp")
+    try:
+        tmp_path.write_text(fingerprint, encoding="utf-8")
+        os.replace(tmp_path, fingerprint_path)
+    except OSError as e:
+        print(f"Warning: could not write build fingerprint: {e}")
 
 
 def build(output_dir:  str= None, output_name=None, debug_mode=False, standalone=True, onefile=False) -> Optional[
@@ -57,7 +108,9 @@ def build(output_dir:  str= None, output_name=None, debug_mode=False, standalone
         "--enable-plugin=pyside6",
         f"--output-dir={output_dir}",
         f"--output-filename={output_name}",
-        f"--report={report_path}"
+        f"--report={report_path}",
+        # Link-time optimization makes the first build slower but the binary faster
+        "--lto=yes",
     ]
 
 
@@ -89,23 +142,43 @@ def build(output_dir:  str= None, output_name=None, debug_mode=False, standalone
     main_file = src_dir / "main.py"
     cmd.append(str(main_file))
 
+    if onefile:
+        output_path = output_dir / f"{output_name}.exe"
+    elif standalone:
+        output_path = output_dir / f"{output_name}.dist" / f"{output_name}.exe"
+    else:
+        output_path = output_dir / f"{output_name}.pyd"  # Or .so on Linux/Mac
+
+    # Compile Qt resources into src before fingerprinting the tree
+    if compile_resources() != 0:
+        print("Build aborted: failed to compile Qt resources")
+        return False
+
+    # Skip the build when neither the sources nor the arguments changed
+    fingerprint, newest_src_mtime_ns = compute_build_fingerprint(src_dir, cmd)
+    output_mtime_ns = output_path.stat().st_mtime_ns if output_path.exists() else 0
+    if output_mtime_ns > newest_src_mtime_ns and read_build_fingerprint(output_dir) == fingerprint:
+        print(f"No source changes; skipping Nuitka. Output at: {output_path}")
+        return True
+
     # Print command
     print("Running Nuitka build with command:")
     print(" ".join(cmd))
     print(f"Build report will be saved to: {report_path}")
 
+    # Keep the C compiler cache and Nuitka's own cache inside the project so
+    # they persist between builds. The first build pays the full C compile;
+    # later builds reuse the cached object files for unchanged modules.
+    env = os.environ.copy()
+    env.setdefault("CCACHE_DIR", str(PROJECT_ROOT / ".ccache"))
+    env.setdefault("NUITKA_CACHE_DIR", str(PROJECT_ROOT / ".nuitka-cache"))
+
     # Execute Nuitka build
-    result = subprocess.run(cmd)
+    result = subprocess.run(cmd, env=env)
 
     if result.returncode == 0:
         # Success
-        if onefile:
-            output_path = output_dir / f"{output_name}.exe"
-        elif standalone:
-            output_path = output_dir / f"{output_name}.dist" / f"{output_name}.exe"
-        else:
-            output_path = output_dir / f"{output_name}.pyd"  # Or .so on Linux/Mac
-
+        write_build_fingerprint(output_dir, fingerprint)
         print(f"Build successful! Output at: {output_path}")
         print(f"Build report saved to: {report_path}")
         return True
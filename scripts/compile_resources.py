@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Compile Qt Resource Files Script
+
+This script compiles src/collector/resources/resources.qrc into the Python
+module src/collector/resources/_rc.py using pyside6-rcc. Importing that
+module registers the resources under the ':/resources/' prefix.
+"""
+import os
+import shutil
+import subprocess
+import sys
+from typing import Optional
+
+from scripts.common import PROJECT_ROOT
+
+RESOURCES_DIR = PROJECT_ROOT / "src" / "collector" / "resources"
+QRC_FILE = RESOURCES_DIR / "resources.qrc"
+RC_MODULE = RESOURCES_DIR / "_rc.py"
+
+
+def check_pyside6_rcc() -> Optional[str]:
+    """
+    Check if pyside6-rcc is available in the system.
+
+    Returns:
+        The rcc command, or None if it is not installed
+    """
+    rcc_cmd = "pyside6-rcc"
+    if shutil.which(rcc_cmd) is None:
+        print(f"Error: {rcc_cmd} not found. Please install PySide6 tools.")
+        return None
+    return rcc_cmd
+
+
+def compile_resources():
+    """Compile the .qrc file to a Python module."""
+    rcc_cmd = check_pyside6_rcc()
+    if rcc_cmd is None:
+        return 1
+
+    if not QRC_FILE.exists():
+        print(f"Error: Resource file not found: {QRC_FILE}")
+        return 1
+
+    print(f"Compiling {QRC_FILE.name} -> {RC_MODULE.name}...")
+    tmp_file = RC_MODULE.with_name(RC_MODULE.name + ".tmp")
+
+    try:
+        subprocess.run(
+            [rcc_cmd, str(QRC_FILE), "-o", str(tmp_file)],
+            check=True,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+    except subprocess.CalledProcessError as e:
+        print(f"Error compiling {QRC_FILE.name}: {e.stderr}")
+        if tmp_file.exists():
+            os.unlink(tmp_file)
+        return 1
+
+    # Leave the existing module untouched when nothing changed, so its
+    # mtime does not invalidate the build fingerprint
+    if RC_MODULE.exists() and RC_MODULE.read_bytes() == tmp_file.read_bytes():
+        os.unlink(tmp_file)
+        print(f"{RC_MODULE.name} is up to date")
+    else:
+        os.replace(tmp_file, RC_MODULE)
+        print(f"Successfully compiled {QRC_FILE.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(compile_resources())
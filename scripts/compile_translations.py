@@ -9,6 +9,8 @@ import os
 import shutil
 import subprocess
 import sys
+import tempfile
+from pathlib import Path
 
 from scripts.common import PROJECT_ROOT
 
@@ -44,32 +46,46 @@ def compile_translations():
     
     print(f"Found {len(ts_files)} translation file(s) to compile:")
     
-    # Process each .ts file
-    success = True
     for ts_file in ts_files:
-        qm_file = ts_file.with_suffix(".qm")
-        print(f"Compiling {ts_file.name} -> {qm_file.name}...")
-        
+        print(f"Compiling {ts_file.name} -> {ts_file.with_suffix('.qm').name}...")
+
+    # lrelease accepts several inputs and writes each .qm next to its .ts.
+    # Run it on copies in a temporary directory and move the results into
+    # place, so a half-written .qm is never picked up by the application.
+    success = True
+    with tempfile.TemporaryDirectory(dir=translations_dir) as tmp_dir:
+        tmp_ts_files = []
+        for ts_file in ts_files:
+            tmp_ts_file = Path(tmp_dir) / ts_file.name
+            shutil.copyfile(ts_file, tmp_ts_file)
+            tmp_ts_files.append(tmp_ts_file)
+
         try:
             result = subprocess.run(
-                [lrelease_cmd, str(ts_file), "-qm", str(qm_file)],
+                [lrelease_cmd, *map(str, tmp_ts_files)],
                 check=True,
-                capture_output=True,
+                stderr=subprocess.PIPE,
                 text=True
             )
-            
+
             if result.stderr:
                 print(f"Warning during compilation: {result.stderr}")
-            
-            # Check if output file was created
-            if qm_file.exists():
-                print(f"Successfully compiled {ts_file.name}")
-            else:
-                print(f"Error: Output file not created for {ts_file.name}")
-                success = False
-                
+
+            for ts_file, tmp_ts_file in zip(ts_files, tmp_ts_files):
+                tmp_qm_file = tmp_ts_file.with_suffix(".qm")
+                if tmp_qm_file.exists():
+                    os.replace(tmp_qm_file, ts_file.with_suffix(".qm"))
+
         except subprocess.CalledProcessError as e:
-            print(f"Error compiling {ts_file.name}: {e.stderr}")
+            print(f"Error compiling translations: {e.stderr}")
+            success = False
+
+    # Check if output files were created
+    for ts_file in ts_files:
+        if ts_file.with_suffix(".qm").exists():
+            print(f"Successfully compiled {ts_file.name}")
+        else:
+            print(f"Error: Output file not created for {ts_file.name}")
             success = False
     
     print("Translation compilation completed.")
@@ -0,0 +1,426 @@
+#!/usr/bin/env python
+"""
+UI Compiler Script
+
+This script automatically scans the project for .ui files in any directory,
+and compiles them to Python files in the parent of each directory containing
+them using pyside6-uic. A design/output directory pair can also be given
+explicitly with --design and --output instead of scanning.
+
+It can also watch for changes to UI files and recompile them automatically.
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib import metadata
+from pathlib import Path
+
+from watchdog.events import (FileCreatedEvent, FileModifiedEvent,
+                             FileSystemEventHandler)
+from watchdog.observers import Observer
+
+from scripts._uic_driver import COMPILED_PREFIX, DRIVER_UNAVAILABLE
+from scripts.common import PROJECT_ROOT
+
+
+# Skip these directories for performance reasons
+SKIP_DIRS = {'.git', '__pycache__', 'venv', 'env', '.venv', '.env', 'node_modules', 'dist', 'build'}
+
+
+def find_ui_directories():
+    """Find all directories containing .ui files in the project."""
+    ui_dirs = []
+
+    # Walk the project, pruning skipped directories before descending into them
+    for root, dirs, files in os.walk(PROJECT_ROOT):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+
+        # Check if this directory contains .ui files
+        if any(f.endswith('.ui') for f in files):
+            path = Path(root)
+            # Create corresponding output directory path
+            ui_dirs.append({
+                "design_dir": path,
+                "output_dir": path.parent
+            })
+
+    return ui_dirs
+
+
+UI_CACHE_FILE = ".ui_cache.json"
+
+# Serializes console output from parallel compile jobs
+_print_lock = threading.Lock()
+
+
+def log(*args, **kwargs):
+    """Thread-safe print."""
+    with _print_lock:
+        print(*args, **kwargs)
+
+
+def get_pyside6_version():
+    """Return the installed PySide6 version, or an empty string if unknown."""
+    try:
+        return metadata.version("PySide6")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def compute_ui_cache_key(ui_file):
+    """Compute the cache key for a UI file from its content and the uic version."""
+    digest = hashlib.sha256(ui_file.read_bytes())
+    digest.update(get_pyside6_version().encode())
+    return digest.hexdigest()
+
+
+def load_ui_cache(output_dir):
+    """Load the compile cache stored in the output directory."""
+    cache_path = output_dir / UI_CACHE_FILE
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_ui_cache(output_dir, cache):
+    """Atomically write the compile cache to the output directory."""
+    cache_path = output_dir / UI_CACHE_FILE
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        log(f"Warning: could not write UI cache {cache_path}: {e}")
+
+
+def is_ui_file_up_to_date(ui_file, py_file, key, cache):
+    """Check whether the generated file matches the cached key for the UI file."""
+    entry = cache.get(ui_file.stem)
+    return py_file.exists() and isinstance(entry, dict) and entry.get("key") == key
+
+
+def compile_ui_files_batch(ui_files, output_dir, cache):
+    """
+    Compile several UI files with a single driver process.
+
+    Returns:
+        True if every file compiled, False if any failed, or None if the
+        driver is unavailable and the caller should compile file by file.
+    """
+    output_dir.mkdir(exist_ok=True, parents=True)
+
+    pairs = []
+    for ui_file in ui_files:
+        py_file = output_dir / f"{ui_file.stem}.py"
+        log(f"Compiling {ui_file.name} -> {py_file.name}...")
+        pairs.extend([str(ui_file), str(py_file)])
+
+    result = subprocess.run(
+        [sys.executable, "-m", "scripts._uic_driver", *pairs],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    if result.returncode == DRIVER_UNAVAILABLE:
+        log(f"UI compiler driver unavailable, compiling files one by one: {result.stderr.strip()}")
+        return None
+
+    if result.stderr:
+        log(f"Warning during compilation: {result.stderr}")
+
+    # Output files the driver reports as written by this run
+    compiled = {line[len(COMPILED_PREFIX):] for line in result.stdout.splitlines()
+                if line.startswith(COMPILED_PREFIX)}
+
+    success = True
+    for ui_file in ui_files:
+        py_file = output_dir / f"{ui_file.stem}.py"
+        if str(py_file) in compiled:
+            log(f"Successfully compiled {ui_file.name}")
+            cache[ui_file.stem] = {"key": compute_ui_cache_key(ui_file), "mtime": ui_file.stat().st_mtime}
+        else:
+            log(f"Error: Output file not created for {ui_file.name}")
+            success = False
+
+    return success
+
+
+def compile_single_ui_file(ui_file, output_dir, cache=None):
+    """
+    Compile a single UI file.
+
+    Compilation is skipped when the generated file exists and the cache entry
+    matches the current content of the UI file. If ``cache`` is not supplied,
+    it is loaded from and saved back to ``output_dir``.
+    """
+    # Ensure output directory exists
+    output_dir.mkdir(exist_ok=True, parents=True)
+
+    ui_name = ui_file.stem
+    py_file = output_dir / f"{ui_name}.py"
+
+    owns_cache = cache is None
+    if owns_cache:
+        cache = load_ui_cache(output_dir)
+
+    key = compute_ui_cache_key(ui_file)
+    if is_ui_file_up_to_date(ui_file, py_file, key, cache):
+        log(f"Skipping {ui_file.name}, {py_file.name} is up to date")
+        return True
+
+    log(f"Compiling {ui_file.name} -> {py_file.name}...")
+
+    # Write to a temporary file so a half-written module is never imported
+    tmp_file = py_file.with_name(py_file.name + ".tmp")
+
+    try:
+        result = subprocess.run(
+            ["pyside6-uic", str(ui_file), "-o", str(tmp_file)],
+            check=True,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+        if result.stderr:
+            log(f"Warning during compilation: {result.stderr}")
+
+        # Check if output file was created
+        if tmp_file.exists():
+            os.replace(tmp_file, py_file)
+            log(f"Successfully compiled {ui_file.name}")
+            cache[ui_name] = {"key": key, "mtime": ui_file.stat().st_mtime}
+            if owns_cache:
+                save_ui_cache(output_dir, cache)
+            return True
+        else:
+            log(f"Error: Output file not created for {ui_file.name}")
+            return False
+
+    except subprocess.CalledProcessError as e:
+        log(f"Error compiling {ui_file.name}: {e.stderr}")
+        if tmp_file.exists():
+            os.unlink(tmp_file)
+        return False
+    except FileNotFoundError:
+        log("Error: pyside6-uic not found. Make sure PySide6 is installed.")
+        log("Install with: pip install PySide6")
+        return False
+
+
+def compile_ui(ui_dirs=None):
+    """
+    Finds and compiles all .ui files to python files.
+
+    Args:
+        ui_dirs: Directory configurations as returned by find_ui_directories.
+            If None, the project is scanned.
+    """
+    if ui_dirs is None:
+        ui_dirs = find_ui_directories()
+
+    if not ui_dirs:
+        log("No directories with UI files found in the project.")
+        return False
+
+    log(f"Found {len(ui_dirs)} directories containing UI files.")
+
+    success = True
+    total_files = 0
+
+    for dir_config in ui_dirs:
+        design_dir = dir_config["design_dir"]
+        output_dir = dir_config["output_dir"]
+
+        # Find all .ui files in design directory
+        ui_files = list(design_dir.glob("*.ui"))
+        total_files += len(ui_files)
+
+        log(f"Found {len(ui_files)} UI file(s) in {design_dir}:")
+
+        # Load the cache once per output directory
+        cache = load_ui_cache(output_dir)
+
+        pending = []
+        for ui_file in ui_files:
+            py_file = output_dir / f"{ui_file.stem}.py"
+            if is_ui_file_up_to_date(ui_file, py_file, compute_ui_cache_key(ui_file), cache):
+                log(f"Skipping {ui_file.name}, {py_file.name} is up to date")
+            else:
+                pending.append(ui_file)
+
+        if pending:
+            # Compile everything in one driver process
+            result = compile_ui_files_batch(pending, output_dir, cache)
+            if result is None:
+                # Fall back to parallel per-file compilation
+                max_workers = min(len(pending), os.cpu_count() or 4)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(compile_single_ui_file, ui_file, output_dir, cache)
+                               for ui_file in pending]
+                    result = all([future.result() for future in as_completed(futures)])
+            if not result:
+                success = False
+
+        save_ui_cache(output_dir, cache)
+
+    log(f"Total UI files compiled: {total_files}")
+    log("UI compilation completed.")
+    return 0 if success else 1
+
+
+# Delay before compiling after the last event for a file, to collapse editor save bursts
+DEBOUNCE_SECONDS = 0.25
+
+
+class UIFileEventHandler(FileSystemEventHandler):
+    """Event handler for UI file changes."""
+
+    def __init__(self, design_dir, output_dir):
+        self.design_dir = design_dir
+        self.output_dir = output_dir
+        # Plain string form of design_dir for cheap comparisons in the event path
+        self._design_dir_str = str(design_dir)
+        self._timers: dict[Path, threading.Timer] = {}
+        self._lock = threading.Lock()
+        # One compile cache per watched directory, shared by all timers; the
+        # lock keeps concurrent compiles from losing each other's entries
+        self._cache = load_ui_cache(output_dir)
+        self._cache_lock = threading.Lock()
+        super().__init__()
+
+    def on_modified(self, event):
+        """Handle file modification events."""
+        if isinstance(event, FileModifiedEvent):
+            self._process_ui_file_event(event)
+
+    def on_created(self, event):
+        """Handle file creation events."""
+        if isinstance(event, FileCreatedEvent):
+            self._process_ui_file_event(event)
+
+    def on_moved(self, event):
+        """Handle file rename/move events."""
+        # This catches the final rename operation that many editors use when saving files
+        if self._is_watched_ui_file(event.dest_path):
+            dest_path = Path(event.dest_path)
+            log(f"\nDetected save of {dest_path.name} (via rename)")
+            self._schedule(dest_path)
+
+    def _process_ui_file_event(self, event):
+        """Process UI file events and compile if needed."""
+        if self._is_watched_ui_file(event.src_path):
+            path = Path(event.src_path)
+            log(f"\nDetected change to {path.name}")
+            self._schedule(path)
+
+    def _is_watched_ui_file(self, src):
+        """Check if a path is a .ui file directly inside the design directory."""
+        # Only process files that end with exactly '.ui' (not '.ui.something')
+        if src[-3:].lower() != '.ui':
+            return False
+        return os.path.dirname(src) == self._design_dir_str
+
+    def _schedule(self, path):
+        """Compile the file once no further events arrive within the debounce window."""
+        with self._lock:
+            timer = self._timers.pop(path, None)
+            if timer:
+                timer.cancel()
+            timer = threading.Timer(DEBOUNCE_SECONDS, self._compile, args=(path,))
+            timer.daemon = True
+            self._timers[path] = timer
+            timer.start()
+
+    def _compile(self, path):
+        """Compile a file whose debounce timer has fired."""
+        with self._lock:
+            self._timers.pop(path, None)
+        with self._cache_lock:
+            if compile_single_ui_file(path, self.output_dir, cache=self._cache):
+                save_ui_cache(self.output_dir, self._cache)
+
+
+def watch(ui_dirs=None):
+    """
+    Watch for changes to UI files and recompile them automatically.
+
+    Args:
+        ui_dirs: Directory configurations as returned by find_ui_directories.
+            If None, the project is scanned.
+    """
+    # First scan for all UI directories
+    if ui_dirs is None:
+        ui_dirs = find_ui_directories()
+
+    if not ui_dirs:
+        log("No directories with UI files found in the project. Nothing to watch.")
+        return False
+
+    # Compile all files first
+    compile_ui(ui_dirs)
+
+    # Share a single observer across all watched directories
+    observer = Observer()
+
+    for dir_config in ui_dirs:
+        design_dir = dir_config["design_dir"]
+        output_dir = dir_config["output_dir"]
+
+        # Set up the event handler for this directory
+        event_handler = UIFileEventHandler(design_dir, output_dir)
+        observer.schedule(event_handler, str(design_dir), recursive=False)
+
+        log(f"Watching for changes in {design_dir}")
+
+    observer.start()
+
+    log(f"\nWatching {len(ui_dirs)} directories for UI file changes.")
+    log("Press Ctrl+C to stop...")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        log("\nStopping file watcher...")
+        observer.stop()
+
+    observer.join()
+
+    return True
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Compile Qt Designer .ui files with pyside6-uic.")
+    parser.add_argument("--design", type=Path, help="Directory containing .ui files (default: scan the project)")
+    parser.add_argument("--output", type=Path, help="Directory for generated files (default: parent of --design)")
+    parser.add_argument("--once", action="store_true", help="Compile once and exit instead of watching")
+    args = parser.parse_args()
+
+    ui_dirs = None
+    if args.design:
+        design_dir = args.design.resolve()
+        output_dir = args.output.resolve() if args.output else design_dir.parent
+        ui_dirs = [{"design_dir": design_dir, "output_dir": output_dir}]
+    elif args.output:
+        parser.error("--output requires --design")
+
+    if args.once:
+        return compile_ui(ui_dirs)
+    return 0 if watch(ui_dirs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
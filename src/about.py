@@ -2,14 +2,83 @@
 """
 About window for the NIKKE Data Collector application.
 """
-import os
+from importlib.resources import as_file, files
+from typing import Optional
 
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QFont, QPixmap
+from PySide6.QtGui import QFont, QIcon, QPixmap, QTextDocument
 from PySide6.QtWidgets import (QDialog, QDialogButtonBox, QLabel, QTextBrowser,
                                QVBoxLayout)
 
-from collector.resources import RESOURCE_DIR
+try:
+    # Registers the ':/resources/' prefix, see scripts/compile_resources.py
+    import collector.resources._rc  # noqa: F401
+except ImportError:
+    # Resources not compiled, the logo is loaded from disk instead
+    pass
+
+_ABOUT_HTML = """
+<p style='text-align:center'>
+    A tool for collecting and analyzing data from NIKKE Arena tournaments.
+</p>
+<p style='text-align:center'>
+    <a href='https://github.com/iBakuman/nikke-data-collector' style='color:#20a8f0'>GitHub Repository</a>
+</p>
+<p style='text-align:center'>
+    <b>Acknowledgements:</b><br>
+    Uses PySide6 for the user interface<br>
+    Uses OpenCV for image recognition<br>
+    Special thanks to contributors and testers
+</p>
+<p style='text-align:center'>
+    <b>Copyright Information:</b><br>
+    © 2023-2024 NIKKE Data Collector Contributors<br>
+    Licensed under the MIT License<br>
+    This is open source software - see the repository for full license details
+</p>
+<p style='text-align:center'>
+    <b>Legal Notice:</b><br>
+    This tool is not affiliated with Shift Up or the official NIKKE game.<br>
+    NIKKE and all related properties are trademarks of their respective owners.
+</p>
+<p style='text-align:center'>
+    <b>Disclaimer:</b><br>
+    This software is for personal learning and research purposes only and not for commercial use.<br>
+    Users must comply with relevant laws and game service terms while using this software.<br>
+    The developers are not responsible for any account issues or losses that may result from using this software.<br>
+    By using this software, you acknowledge that you have read and agreed to the above statement.
+</p>
+"""
+
+# Parsed once from _ABOUT_HTML, then cloned for each dialog
+_ABOUT_DOC: Optional[QTextDocument] = None
+
+
+def _get_about_document() -> QTextDocument:
+    """Return the parsed about document, parsing the HTML on first use."""
+    global _ABOUT_DOC
+    if _ABOUT_DOC is None:
+        _ABOUT_DOC = QTextDocument()
+        _ABOUT_DOC.setHtml(_ABOUT_HTML)
+    return _ABOUT_DOC
+
+
+def _load_logo_pixmap() -> QPixmap:
+    """
+    Load the largest frame of the application logo.
+
+    Uses the compiled Qt resource when available, otherwise the logo.ico
+    shipped in the collector.resources package.
+    """
+    logo_icon = QIcon(":/resources/logo.ico")
+    if not logo_icon.isNull():
+        return logo_icon.pixmap(256)
+    try:
+        with as_file(files("collector.resources").joinpath("logo.ico")) as path:
+            # QIcon loads lazily, so render the pixmap while the file exists
+            return QIcon(str(path)).pixmap(256)
+    except (FileNotFoundError, ModuleNotFoundError):
+        return QPixmap()
 
 
 class AboutWindow(QDialog):
@@ -17,6 +86,10 @@ class AboutWindow(QDialog):
     Dialog window that shows information about the application,
     including version, credits, and license information.
     """
+
+    # Scaled logo shared by all instances, loaded on first show
+    _logo_cache: Optional[QPixmap] = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -29,18 +102,12 @@ class AboutWindow(QDialog):
         # Create layout
         layout = QVBoxLayout(self)
 
-        # Try to add logo if it exists
-        try:
-            logo_path = os.path.join(RESOURCE_DIR, "logo.png")
-            if os.path.exists(logo_path):
-                logo_label = QLabel(self)
-                logo_pixmap = QPixmap(logo_path)
-                logo_label.setPixmap(logo_pixmap.scaledToWidth(128, Qt.TransformationMode.SmoothTransformation))
-                logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                layout.addWidget(logo_label)
-        except Exception:
-            # Continue without logo if it can't be loaded
-            pass
+        # Logo and description are built on first show, see _build_body
+        self._built = False
+        self._logo_label = QLabel(self)
+        self._logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._logo_label.hide()
+        layout.addWidget(self._logo_label)
 
         # Add title and version
         title_label = QLabel("NIKKE Data Collector", self)
@@ -56,42 +123,10 @@ class AboutWindow(QDialog):
         layout.addWidget(version_label)
 
         # Add description
-        description = QTextBrowser(self)
-        description.setOpenExternalLinks(True)
-        description.setHtml("""
-        <p style='text-align:center'>
-            A tool for collecting and analyzing data from NIKKE Arena tournaments.
-        </p>
-        <p style='text-align:center'>
-            <a href='https://github.com/iBakuman/nikke-data-collector' style='color:#20a8f0'>GitHub Repository</a>
-        </p>
-        <p style='text-align:center'>
-            <b>Acknowledgements:</b><br>
-            Uses PySide6 for the user interface<br>
-            Uses OpenCV for image recognition<br>
-            Special thanks to contributors and testers
-        </p>
-        <p style='text-align:center'>
-            <b>Copyright Information:</b><br>
-            © 2023-2024 NIKKE Data Collector Contributors<br>
-            Licensed under the MIT License<br>
-            This is open source software - see the repository for full license details
-        </p>
-        <p style='text-align:center'>
-            <b>Legal Notice:</b><br>
-            This tool is not affiliated with Shift Up or the official NIKKE game.<br>
-            NIKKE and all related properties are trademarks of their respective owners.
-        </p>
-        <p style='text-align:center'>
-            <b>Disclaimer:</b><br>
-            This software is for personal learning and research purposes only and not for commercial use.<br>
-            Users must comply with relevant laws and game service terms while using this software.<br>
-            The developers are not responsible for any account issues or losses that may result from using this software.<br>
-            By using this software, you acknowledge that you have read and agreed to the above statement.
-        </p>
-        """)
-        description.setMinimumHeight(150)
-        layout.addWidget(description)
+        self._description = QTextBrowser(self)
+        self._description.setOpenExternalLinks(True)
+        self._description.setMinimumHeight(150)
+        layout.addWidget(self._description)
 
         # Add OK button
         buttonBox = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
@@ -100,3 +135,29 @@ class AboutWindow(QDialog):
 
         # Set the layout
         self.setLayout(layout)
+
+    def showEvent(self, event):
+        """Build the logo and description the first time the dialog is shown."""
+        if not self._built:
+            self._build_body()
+            self._built = True
+        super().showEvent(event)
+
+    def _build_body(self):
+        """Load the logo and fill in the description."""
+        # Try to add logo if it exists
+        try:
+            if AboutWindow._logo_cache is None:
+                logo_pixmap = _load_logo_pixmap()
+                if not logo_pixmap.isNull():
+                    logo_pixmap = logo_pixmap.scaledToWidth(128, Qt.TransformationMode.SmoothTransformation)
+                # A null pixmap is cached too, so a missing logo is not looked up again
+                AboutWindow._logo_cache = logo_pixmap
+            if not AboutWindow._logo_cache.isNull():
+                self._logo_label.setPixmap(AboutWindow._logo_cache)
+                self._logo_label.show()
+        except Exception:
+            # Continue without logo if it can't be loaded
+            pass
+
+        self._description.setDocument(_get_about_document().clone(self._description))
@@ -4,6 +4,7 @@ Administrator privilege helper for NIKKE Arena.
 This utility checks for admin rights and can restart the application with elevated privileges.
 """
 import ctypes
+import functools
 import locale
 import os
 import subprocess
@@ -13,11 +14,48 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (QApplication, QLabel, QMainWindow, QMessageBox,
                                QPushButton, QVBoxLayout, QWidget)
 
-
+# UI strings, selected once per window by system language
+_STRINGS_ZH = {
+    "window_title": "管理员权限检查",
+    "exit": "退出",
+    "admin_status": "✅ 已以管理员身份运行",
+    "admin_info": "程序已经拥有管理员权限，可以正常运行NIKKE Arena。",
+    "admin_action": "启动NIKKE Arena",
+    "no_admin_status": "❌ 没有管理员权限",
+    "no_admin_info": "NIKKE Arena需要管理员权限才能正常运行。\n"
+                     "点击下方按钮以管理员身份重启应用。",
+    "no_admin_action": "以管理员身份重启",
+    "error_title": "错误",
+    "restart_failed": "无法以管理员身份重启应用程序。",
+    "restart_failed_info": "请手动右键点击应用程序并选择'以管理员身份运行'。",
+    "launch_failed": "启动主应用程序时出错: {error}",
+}
+
+_STRINGS_EN = {
+    "window_title": "Admin Rights Check",
+    "exit": "Exit",
+    "admin_status": "✅ Running as Administrator",
+    "admin_info": "The application has administrator privileges and can run NIKKE Arena normally.",
+    "admin_action": "Launch NIKKE Arena",
+    "no_admin_status": "❌ No Administrator Rights",
+    "no_admin_info": "NIKKE Arena requires administrator privileges to function properly.\n"
+                     "Click the button below to restart with elevated privileges.",
+    "no_admin_action": "Restart as Administrator",
+    "error_title": "Error",
+    "restart_failed": "Failed to restart application with administrator privileges.",
+    "restart_failed_info": "Please manually right-click the application and select 'Run as administrator'.",
+    "launch_failed": "Error launching main application: {error}",
+}
+
+
+@functools.lru_cache(maxsize=1)
 def is_admin():
     """
     Check if the program is running with administrator privileges
 
+    The result is cached: a process's elevation does not change while it runs.
+    A restart with elevated rights is a new process.
+
     Returns:
         bool: True if running as administrator, False otherwise
     """
@@ -55,20 +93,50 @@ def restart_as_admin():
         return False
 
 
+def launch_detached(executable, script):
+    """
+    Start a program with ShellExecute without waiting for it
+
+    Args:
+        executable: Program to run
+        script: Script path passed as the only argument
+
+    Returns:
+        bool: True if the program was started, False otherwise
+    """
+    try:
+        # ShellExecuteW returns a value greater than 32 on success
+        result = ctypes.windll.shell32.ShellExecuteW(
+            None, "open", executable, f'"{script}"', None, 1
+        )
+        return result > 32
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
 def get_system_language():
     """
-    Get the system language using non-deprecated methods
+    Get the system language without changing the process locale
+
+    The result is cached for the lifetime of the process.
     
     Returns:
         bool: True if the system language is Chinese, False otherwise
     """
     try:
-        # Set locale to system default
-        locale.setlocale(locale.LC_ALL, '')
-        # Get current locale
+        # Explicit locale variables take precedence, as on POSIX systems
+        lang = os.environ.get('LC_ALL') or os.environ.get('LC_MESSAGES') or os.environ.get('LANG')
+        if lang:
+            return lang.lower().startswith('zh')
+
+        # Windows: primary language ID of the user's UI language (0x04 is Chinese)
+        if hasattr(ctypes, 'windll'):
+            return ctypes.windll.kernel32.GetUserDefaultUILanguage() & 0x3FF == 0x04
+
+        # Locale Python picked up at startup; no setlocale call needed
         system_lang = locale.getlocale()[0]
-        # Check if it's Chinese
-        return system_lang and system_lang.startswith(('zh_', 'zh-'))
+        return bool(system_lang) and system_lang.lower().startswith(('zh', 'chinese'))
     except Exception as e:
         print(f"Error detecting system language: {e}")
         return False
@@ -80,14 +148,12 @@ class AdminHelperWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # Check system language
+        # Check system language and pick the matching strings
         self.is_chinese = get_system_language()
+        self._strings = _STRINGS_ZH if self.is_chinese else _STRINGS_EN
 
         # Set up the window
-        if self.is_chinese:
-            self.setWindowTitle("管理员权限检查")
-        else:
-            self.setWindowTitle("Admin Rights Check")
+        self.setWindowTitle(self._strings["window_title"])
 
         self.setMinimumSize(400, 200)
 
@@ -115,46 +181,27 @@ class AdminHelperWindow(QMainWindow):
         layout.addWidget(self.action_button)
 
         # Exit button
-        if self.is_chinese:
-            exit_text = "退出"
-        else:
-            exit_text = "Exit"
-
-        exit_button = QPushButton(exit_text)
+        exit_button = QPushButton(self._strings["exit"])
         exit_button.clicked.connect(self.close)
         layout.addWidget(exit_button)
 
         # Set the central widget
         self.setCentralWidget(central_widget)
 
+        # Error dialog, reused for every failure
+        self._error_box = QMessageBox(self)
+        self._error_box.setIcon(QMessageBox.Icon.Critical)
+        self._error_box.setWindowTitle(self._strings["error_title"])
+
         # Check admin status and update UI
         self.update_ui()
 
     def update_ui(self):
         """Update UI based on admin status"""
-        has_admin = is_admin()
-
-        if self.is_chinese:
-            if has_admin:
-                self.status_label.setText("✅ 已以管理员身份运行")
-                self.info_label.setText("程序已经拥有管理员权限，可以正常运行NIKKE Arena。")
-                self.action_button.setText("启动NIKKE Arena")
-            else:
-                self.status_label.setText("❌ 没有管理员权限")
-                self.info_label.setText("NIKKE Arena需要管理员权限才能正常运行。\n"
-                                        "点击下方按钮以管理员身份重启应用。")
-                self.action_button.setText("以管理员身份重启")
-        else:
-            if has_admin:
-                self.status_label.setText("✅ Running as Administrator")
-                self.info_label.setText(
-                    "The application has administrator privileges and can run NIKKE Arena normally.")
-                self.action_button.setText("Launch NIKKE Arena")
-            else:
-                self.status_label.setText("❌ No Administrator Rights")
-                self.info_label.setText("NIKKE Arena requires administrator privileges to function properly.\n"
-                                        "Click the button below to restart with elevated privileges.")
-                self.action_button.setText("Restart as Administrator")
+        state = "admin" if is_admin() else "no_admin"
+        self.status_label.setText(self._strings[f"{state}_status"])
+        self.info_label.setText(self._strings[f"{state}_info"])
+        self.action_button.setText(self._strings[f"{state}_action"])
 
     def on_action_button_clicked(self):
         """Handle action button click"""
@@ -168,20 +215,7 @@ class AdminHelperWindow(QMainWindow):
                 self.close()
             else:
                 # Show error if restart failed
-                msg = QMessageBox(self)
-                msg.setIcon(QMessageBox.Icon.Critical)
-
-                if self.is_chinese:
-                    msg.setWindowTitle("错误")
-                    msg.setText("无法以管理员身份重启应用程序。")
-                    msg.setInformativeText("请手动右键点击应用程序并选择'以管理员身份运行'。")
-                else:
-                    msg.setWindowTitle("Error")
-                    msg.setText("Failed to restart application with administrator privileges.")
-                    msg.setInformativeText(
-                        "Please manually right-click the application and select 'Run as administrator'.")
-
-                msg.exec()
+                self.show_error(self._strings["restart_failed"], self._strings["restart_failed_info"])
 
     def launch_main_app(self):
         """Launch the main application"""
@@ -196,25 +230,23 @@ class AdminHelperWindow(QMainWindow):
 
             main_script = os.path.join(main_dir, "main.py")
 
-            # Start the main application
-            subprocess.Popen([sys.executable, main_script])
+            # Start the main application through the shell, like restart_as_admin,
+            # falling back to subprocess if ShellExecute is unavailable or fails
+            if not launch_detached(sys.executable, main_script):
+                subprocess.Popen([sys.executable, main_script])
 
             # Close this helper
             self.close()
 
         except Exception as e:
             # Show error if launch failed
-            msg = QMessageBox(self)
-            msg.setIcon(QMessageBox.Icon.Critical)
-
-            if self.is_chinese:
-                msg.setWindowTitle("错误")
-                msg.setText(f"启动主应用程序时出错: {e}")
-            else:
-                msg.setWindowTitle("Error")
-                msg.setText(f"Error launching main application: {e}")
+            self.show_error(self._strings["launch_failed"].format(error=e))
 
-            msg.exec()
+    def show_error(self, text, informative_text=""):
+        """Show the shared error dialog with the given message"""
+        self._error_box.setText(text)
+        self._error_box.setInformativeText(informative_text)
+        self._error_box.exec()
 
 
 def main():
@@ -4,17 +4,26 @@ NIKKE Arena module
 This module provides tools for automating and processing NIKKE arena features.
 """
 
-import logging
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-
-from .character_matcher import CharacterMatcher, MatchResult
-from .image_processor import ImageProcessor
-
+import importlib
 
 __all__ = [
     'CharacterMatcher',
     'MatchResult',
     'ImageProcessor',
 ]
+
+# Exported names and the submodules defining them. They are imported on first
+# access so that importing a light submodule does not pull in OpenCV, NumPy
+# and diskcache through this package.
+_LAZY_EXPORTS = {
+    'CharacterMatcher': '.character_matcher',
+    'MatchResult': '.character_matcher',
+    'ImageProcessor': '.image_processor',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,7 @@ This module contains the BattleResultCollector class which is responsible
 for collecting battle results from recorded matches.
 """
 from .image_detector import ImageDetector
+from .lazy_image import LazyImage
 from .logging_config import get_logger
 from .models import BattleResult, BattleData
 from .mouse_control import MouseController
@@ -33,6 +34,11 @@ class BattleDataCollector:
         self.detector = detector
         self.capturer = capturer
         self.controller = controller
+        # (win, lose) detectable images for rounds 1-5, resolved once
+        self._round_templates = [
+            (BATTLE_RESULT.get_detectable_win_image(round_num), BATTLE_RESULT.get_detectable_lose_image(round_num))
+            for round_num in range(1, 6)
+        ]
 
     def copy_user_id(self, is_left: bool) -> str:
         """
@@ -55,16 +61,24 @@ class BattleDataCollector:
         right_user_id = self.copy_user_id(is_left=False)
         battle_data = BattleData(left_user_id=left_user_id, right_user_id=right_user_id)
 
+        # Capture the result area once, check every round's templates against it
+        # and keep the same frame as the battle image
+        targets = {}
+        for round_num, (win_image, lose_image) in enumerate(self._round_templates, 1):
+            targets[f"win_{round_num}"] = win_image
+            targets[f"lose_{round_num}"] = lose_image
+        frame = self.capturer.capture_region(BATTLE_RESULT.get_total_region())
+        detected = self.detector.find_all_in_frame(frame, targets) if frame else {}
+
         for round_num in range(1, 6):
-            if self.detector.is_image_present(BATTLE_RESULT.get_detectable_win_image(round_num)):
+            if detected.get(f"win_{round_num}"):
                 battle_data.result.append(BattleResult.VICTORY)
-            elif self.detector.is_image_present(BATTLE_RESULT.get_detectable_lose_image(round_num)):
+            elif detected.get(f"lose_{round_num}"):
                 battle_data.result.append(BattleResult.DEFEAT)
             else:
                 battle_data.result.append(BattleResult.UNKNOWN)
                 logger.warning(f"Could not determine battle result for round {round_num}")
-        capture_result = self.capturer.capture_region(BATTLE_RESULT.get_total_region())
-        if capture_result:
-            battle_data.image = capture_result.to_pil()
+        if frame:
+            battle_data.image = LazyImage(frame.to_cv())
         self.controller.click_at_position(BATTLE_RESULT.close)
         return battle_data
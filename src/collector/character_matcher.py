@@ -1,5 +1,9 @@
-from dataclasses import dataclass
-from typing import Optional, Tuple, Union
+import collections
+import functools
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 from PIL import Image
@@ -12,6 +16,10 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# References are matched at 1/MATCH_DOWNSCALE of their stored size, which cuts
+# the template memory read on every match by MATCH_DOWNSCALE squared
+MATCH_DOWNSCALE = 2
+
 
 @dataclass
 class MatchResult:
@@ -25,6 +33,14 @@ class MatchResult:
         return self.character is not None
 
 
+@dataclass
+class _ReferenceGroup:
+    """Reference images sharing one shape, stacked for batched matching"""
+    shape: Tuple[int, int]  # (height, width) of every image in the group
+    characters: List[Character] = field(default_factory=list)
+    templates: Optional[np.ndarray] = None  # Normalized rows, see ImageProcessor.normalize_templates
+
+
 class CharacterMatcher:
     """
     Character matchers that matches images against character references in SQLite database.
@@ -41,12 +57,34 @@ class CharacterMatcher:
         Args:
             cache_dir: Directory to store the disk cache
             character_dao: Data access object for character data
-            similarity_threshold: Minimum similarity score to consider a match valid (optional)
+            similarity_threshold: Minimum similarity score to consider a match valid (optional).
+                When set, a recently matched reference that reaches it is returned
+                without scanning the remaining references.
             cache_size_limit: Maximum cache size in bytes (default: 1GB)
         """
         self.cache = Cache(cache_dir, size_limit=cache_size_limit)
         self.similarity_threshold = similarity_threshold
         self.character_dao = character_dao
+        # Character data does not change during a session, so query the database once
+        self._get_all_characters = functools.lru_cache(maxsize=None)(character_dao.get_all_characters)
+        self._get_character_images = functools.lru_cache(maxsize=None)(character_dao.get_character_images)
+        # Guards loading of the reference caches below
+        self._reference_lock = threading.RLock()
+        # Preprocessed reference images as (character, image_id, image), loaded on first match
+        self._references: Optional[List[Tuple[Character, int, np.ndarray]]] = None
+        # References grouped by image shape for batched matching
+        self._reference_groups: Optional[List[_ReferenceGroup]] = None
+        # In-memory LRU of recent match results in front of the disk cache
+        self._hot: collections.OrderedDict = collections.OrderedDict()
+        self._hot_max = 4096
+        # (cache key, result) of the previous match, kept as one tuple so threads
+        # never see a key paired with another query's result
+        self._last_match: Optional[Tuple[int, MatchResult]] = None
+        self._hot_lock = threading.Lock()
+        # Recently matched references as (group index, row) in LRU order, tried
+        # first when a similarity threshold allows stopping at a good enough match
+        self._ref_order: collections.OrderedDict = collections.OrderedDict()
+        self._ref_order_max = 16
 
         logger.info(f"Cache initialized at: {cache_dir}")
         logger.info(
@@ -65,39 +103,40 @@ class CharacterMatcher:
         # Preprocess query image
         preprocessed_query = ImageProcessor.preprocess_image(query_image)
 
+        groups = self._get_reference_groups()
+        query_vectors = {}
+
+        # Try recently matched references first and stop at the first one
+        # that clears the threshold
+        if self.similarity_threshold is not None:
+            with self._hot_lock:
+                recent = list(self._ref_order)
+            for group_index, row in recent:
+                group = groups[group_index]
+                if group_index not in query_vectors:
+                    query_vectors[group_index] = ImageProcessor.prepare_query(preprocessed_query, group.shape)
+                similarity = float(group.templates[row] @ query_vectors[group_index])
+                if similarity >= self.similarity_threshold:
+                    self._touch_reference(group_index, row)
+                    logger.info(
+                        f"Best match: ID={group.characters[row].id}, similarity={similarity:.4f} (threshold={self.similarity_threshold:.4f}, recent match)")
+                    return group.characters[row], similarity
+
         best_match = None
         best_similarity = 0.0
+        best_ref = None
 
-        # Get all characters from database
-        characters = self.character_dao.get_all_characters()
-
-        for character in characters:
-            # Get all images for this character
-            char_images = self.character_dao.get_character_images(character.id)
-
-            # Skip if no images for this character
-            if not char_images:
-                continue
-
-            # Test each image
-            for image_id, image_data in char_images:
-                try:
-                    # Convert blob to OpenCV image and preprocess
-                    ref_image = ImageProcessor.blob_to_cv_image(image_data)
-                    preprocessed_ref = ImageProcessor.preprocess_image(ref_image)
-
-                    # Match images
-                    similarity = ImageProcessor.match_with_template(
-                        preprocessed_query, preprocessed_ref
-                    )
-
-                    # Update best match if better
-                    if similarity > best_similarity:
-                        best_similarity = similarity
-                        best_match = character
-
-                except Exception as e:
-                    logger.error(f"Error processing character image {character.id}/{image_id}: {e}")
+        # Score every reference of a given shape in one vectorized pass
+        for group_index, group in enumerate(groups):
+            if group_index in query_vectors:
+                similarities = group.templates @ query_vectors[group_index]
+            else:
+                similarities = ImageProcessor.match_batch(preprocessed_query, group.templates, group.shape)
+            index = int(np.argmax(similarities))
+            if similarities[index] > best_similarity:
+                best_similarity = float(similarities[index])
+                best_match = group.characters[index]
+                best_ref = (group_index, index)
 
         # Check against threshold if set
         if self.similarity_threshold is None:
@@ -105,6 +144,9 @@ class CharacterMatcher:
                 f"Best match: ID={best_match.id if best_match else None}, similarity={best_similarity:.4f} (no threshold applied)")
             return best_match, best_similarity
         elif best_similarity >= self.similarity_threshold:
+            # best_ref stays unset when no reference scored above 0 (threshold <= 0)
+            if best_ref is not None:
+                self._touch_reference(*best_ref)
             logger.info(
                 f"Best match: ID={best_match.id if best_match else None}, similarity={best_similarity:.4f} (threshold={self.similarity_threshold:.4f})")
             return best_match, best_similarity
@@ -113,6 +155,83 @@ class CharacterMatcher:
                 f"No match found with similarity >= {self.similarity_threshold:.4f} (best was {best_similarity:.4f})")
             return None, best_similarity
 
+    def _touch_reference(self, group_index: int, row: int):
+        """Mark a reference as the most recently matched one."""
+        with self._hot_lock:
+            key = (group_index, row)
+            self._ref_order[key] = None
+            self._ref_order.move_to_end(key, last=False)
+            while len(self._ref_order) > self._ref_order_max:
+                self._ref_order.popitem()
+
+    def _get_references(self) -> List[Tuple[Character, int, np.ndarray]]:
+        """
+        Get the preprocessed reference images, loading them on first use.
+
+        Returns:
+            List of (character, image_id, preprocessed_image) tuples
+        """
+        with self._reference_lock:
+            if self._references is None:
+                self._references = self._warm_reference_cache()
+            return self._references
+
+    def _get_reference_groups(self) -> List[_ReferenceGroup]:
+        """
+        Get the reference images grouped by shape, building the groups on first use.
+
+        Returns:
+            List of reference groups
+        """
+        with self._reference_lock:
+            if self._reference_groups is None:
+                images_by_shape = {}
+                groups = {}
+                for character, _, preprocessed_ref in self._get_references():
+                    preprocessed_ref = ImageProcessor.shrink(preprocessed_ref, MATCH_DOWNSCALE)
+                    shape = preprocessed_ref.shape[:2]
+                    if shape not in groups:
+                        groups[shape] = _ReferenceGroup(shape=shape)
+                        images_by_shape[shape] = []
+                    groups[shape].characters.append(character)
+                    images_by_shape[shape].append(preprocessed_ref)
+                for shape, group in groups.items():
+                    group.templates = ImageProcessor.normalize_templates(np.stack(images_by_shape[shape]))
+                self._reference_groups = list(groups.values())
+            return self._reference_groups
+
+    def _warm_reference_cache(self) -> List[Tuple[Character, int, np.ndarray]]:
+        """
+        Load and preprocess every reference image from the database.
+
+        Preprocessed images are also stored in the disk cache, keyed by the
+        image id and a digest of its data, so later sessions skip decoding.
+
+        Returns:
+            List of (character, image_id, preprocessed_image) tuples
+        """
+        references = []
+        characters = self._get_all_characters() or []
+
+        for character in characters:
+            # Get all images for this character
+            for image_id, image_data in self._get_character_images(character.id):
+                key = f"ref:{character.id}:{image_id}:{hashlib.md5(image_data).hexdigest()}"
+                preprocessed_ref = self.cache.get(key)
+                if preprocessed_ref is None:
+                    try:
+                        # Convert blob to OpenCV image and preprocess
+                        ref_image = ImageProcessor.blob_to_cv_image(image_data)
+                        preprocessed_ref = ImageProcessor.preprocess_image(ref_image)
+                    except Exception as e:
+                        logger.error(f"Error processing character image {character.id}/{image_id}: {e}")
+                        continue
+                    self.cache.set(key, preprocessed_ref)
+                references.append((character, image_id, preprocessed_ref))
+
+        logger.info(f"Loaded {len(references)} reference images for {len(characters)} characters")
+        return references
+
     def _match_core(self, query_image: np.ndarray, image_source: str = "Unknown") -> MatchResult:
         """
         Core matching logic used by the match method.
@@ -125,20 +244,31 @@ class CharacterMatcher:
             MatchResult containing the character information and similarity score
         """
         try:
+            # Convert to grayscale once; hashing and matching both work on it
+            query_image = ImageProcessor.preprocess_image(query_image)
+
             # Compute hash for cache lookup
             cache_key = ImageProcessor.compute_image_hash(query_image)
 
-            # Check if result is in cache
-            if cache_key in self.cache:
-                cached_result = self.cache[cache_key]
+            # Consecutive captures of the same screen are usually identical
+            last_match = self._last_match
+            if last_match is not None and last_match[0] == cache_key:
+                return last_match[1]
+
+            # Check the in-memory cache first, then the disk cache
+            cached_result = self._hot_get(cache_key)
+            if cached_result is None:
+                cached_result = self.cache.get(cache_key)
+                if cached_result is not None:
+                    self._hot_put(cache_key, cached_result)
+            if cached_result is not None:
                 logger.info(f"Cache hit for image from {image_source}")
 
                 # Reconstruct MatchResult from cached data
-                if cached_result is None:
-                    return MatchResult(None, 0.0)
-
                 character, similarity = cached_result
-                return MatchResult(character, similarity)
+                result = MatchResult(character, similarity)
+                self._last_match = (cache_key, result)
+                return result
 
             logger.info(f"Cache miss for image from {image_source}, performing matching...")
 
@@ -149,7 +279,9 @@ class CharacterMatcher:
             result = MatchResult(character, similarity)
 
             # Cache the result
+            self._hot_put(cache_key, (character, similarity))
             self.cache[cache_key] = (character, similarity)
+            self._last_match = (cache_key, result)
 
             return result
 
@@ -157,6 +289,22 @@ class CharacterMatcher:
             logger.error(f"Error in _match_core: {e}")
             return MatchResult(None, 0.0)
 
+    def _hot_get(self, key):
+        """Look up a result in the in-memory cache, marking it as recently used."""
+        with self._hot_lock:
+            value = self._hot.get(key)
+            if value is not None:
+                self._hot.move_to_end(key)
+            return value
+
+    def _hot_put(self, key, value):
+        """Store a result in the in-memory cache, evicting the oldest when full."""
+        with self._hot_lock:
+            self._hot[key] = value
+            self._hot.move_to_end(key)
+            while len(self._hot) > self._hot_max:
+                self._hot.popitem(last=False)
+
     def match(self, image: Union[str, np.ndarray, Image.Image]) -> MatchResult:
         """
         Universal match method that accepts different image input types.
@@ -199,4 +347,13 @@ class CharacterMatcher:
     def clear_cache(self):
         """Clear the entire cache"""
         self.cache.clear()
+        self._last_match = None
+        with self._hot_lock:
+            self._hot.clear()
+            self._ref_order.clear()
+        self._get_all_characters.cache_clear()
+        self._get_character_images.cache_clear()
+        with self._reference_lock:
+            self._references = None
+            self._reference_groups = None
         logger.info("Character detector cache cleared")
\ No newline at end of file
@@ -29,6 +29,10 @@ class DelayManager:
         """
         self._min_delay = min_delay
         self._max_delay = max_delay
+        self._range = max_delay - min_delay
+        self._rand = random.random
+        # Monotonic time until which a delay started with begin_delay runs
+        self._deadline = 0.0
 
     @property
     def delay_range(self) -> Tuple[float, float]:
@@ -53,6 +57,7 @@ class DelayManager:
 
         self._min_delay = min_delay
         self._max_delay = max_delay
+        self._range = max_delay - min_delay
 
     def get_random_delay(self) -> float:
         """
@@ -61,7 +66,7 @@ class DelayManager:
         Returns:
             A random float between min_delay and max_delay
         """
-        return random.uniform(self._min_delay, self._max_delay)
+        return self._min_delay + self._range * self._rand()
 
     def sleep(self) -> float:
         """
@@ -74,6 +79,34 @@ class DelayManager:
         time.sleep(delay)
         return delay
 
+    def begin_delay(self) -> float:
+        """
+        Start a random delay without blocking.
+        
+        The caller can do other work and then call wait() to block only for
+        whatever part of the delay is left.
+        
+        Returns:
+            The monotonic time at which the delay ends
+        """
+        self._deadline = time.monotonic() + self.get_random_delay()
+        return self._deadline
+
+    def wait(self) -> float:
+        """
+        Block until the delay started by begin_delay has elapsed.
+        
+        Returns immediately if no delay is pending.
+        
+        Returns:
+            The time actually slept in seconds
+        """
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            return 0.0
+        time.sleep(remaining)
+        return remaining
+
     def sleep_with_factor(self, factor: float = 1.0) -> float:
         """
         Sleep for a random duration multiplied by a factor.
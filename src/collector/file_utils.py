@@ -0,0 +1,16 @@
+import functools
+import os
+
+
+@functools.lru_cache(maxsize=1024)
+def ensure_dir(path: str) -> None:
+    """
+    Create a directory if it doesn't exist.
+
+    Cached per path, so saving many files into the same directory only
+    touches the filesystem once.
+
+    Args:
+        path: Directory path
+    """
+    os.makedirs(path, exist_ok=True)
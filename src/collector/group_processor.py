@@ -4,11 +4,11 @@ Group Result Processor
 This module provides functionality to capture and combine character images
 from the group result screen in NIKKE, along with user IDs.
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
-from PIL.Image import Image
-
 from collector.window_capturer import WindowCapturer
+from .lazy_image import LazyImage
 from .lineup_processor import LineupProcessor
 from .logging_config import get_logger
 from .models import Group, User
@@ -32,6 +32,8 @@ class GroupProcessor:
         self.lineup_capturer = lineup_processor
         self.horizontal_gap = horizontal_gap
         self.boundary_gap = boundary_gap
+        # Avatar positions indexed by user index (1-4)
+        self._avatar_positions = [None] + [GROUP_DETAIL.get_participant_avatar(i) for i in range(1, 5)]
 
     def process(self, user_indices: Optional[List[int]] = None) -> Optional[Group]:
         """
@@ -51,27 +53,43 @@ class GroupProcessor:
                 logger.error("No valid user indices provided")
                 return None
 
-            result_image = self.capturer.capture_region(GROUP_DETAIL.result_region).to_pil()
+            result_image = LazyImage(self.capturer.capture_region(GROUP_DETAIL.result_region).to_cv())
+            # Clicks must happen one at a time, but each user's image analysis
+            # can run in the background while the next user is being captured
+            futures = []
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for user_index in process_indices:
+                    raw_user = self._click_and_grab_raw(user_index)
+                    futures.append((user_index, executor.submit(self._analyze, raw_user)))
+                self.controller.wait_for_delay()
+
             users: List[User] = []
-            for user_index in process_indices:
-                user = self._process_single_user(user_index)
+            for user_index, future in futures:
+                user = future.result()
                 if user is None:
                     logger.error(f"Failed to process user {user_index}")
+                    continue
                 users.append(user)
 
-            user_images = [user.team_image for user in users if user.team_image is not None]
+            user_images = [user.team_image.pil for user in users if user.team_image is not None]
 
-            combined_image: Optional[Image] = None
+            combined_image: Optional[LazyImage] = None
             if user_images:
-                combined_image = combine_images(self.horizontal_gap, self.boundary_gap, user_images)
+                combined_image = LazyImage(combine_images(self.horizontal_gap, self.boundary_gap, user_images))
             return Group(users=users, combined_image=combined_image, result_image=result_image)
 
         except Exception as e:
             logger.error(f"Error processing users: {e}")
             return None
 
-    def _process_single_user(self, user_index: int) -> Optional[User]:
-        avatar_pos = GROUP_DETAIL.get_participant_avatar(user_index)
-        self.controller.click_at_position(avatar_pos)
+    def _click_and_grab_raw(self, user_index: int) -> Optional[User]:
+        if not self.controller.click_at_position(self._avatar_positions[user_index]):
+            logger.warning(f"Failed to click on user {user_index} avatar, skipping")
+            return None
         logger.info(f"Clicked on user {user_index} avatar to show team info")
-        return self.lineup_capturer.process()
+        return self.lineup_capturer.capture()
+
+    def _analyze(self, raw_user: Optional[User]) -> Optional[User]:
+        if raw_user is None:
+            return None
+        return self.lineup_capturer.analyze(raw_user)
@@ -1,13 +1,16 @@
 import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
+import cv2
+import numpy as np
 import pyautogui
 from PIL import Image
 from pyscreeze import Box
 
+from .image_processor import ImageProcessor
 from .logging_config import get_logger
 from .ui_def import DetectableImage
-from .window_capturer import WindowCapturer
+from .window_capturer import CaptureResult, WindowCapturer
 from .window_info import WindowInfo
 from .window_manager import WindowManager
 
@@ -28,6 +31,8 @@ class ImageDetector:
         """
         self.window_capturer = window_capturer
         self.window_manager = window_manager
+        # Scaled BGR templates keyed by (image_path, width_ratio, height_ratio)
+        self._template_cache: Dict[Tuple[str, float, float], Optional[np.ndarray]] = {}
         self.debug_path = None
         if debug_path is not None:
             self.debug_path = debug_path
@@ -65,17 +70,19 @@ class ImageDetector:
                 logger.error("Failed to capture region")
                 return None
 
-            target_image = Image.open(image_path)
-            target_image = self._scale_image(target_image, window_info)
+            # Decoded and scaled once per window size rather than on every check
+            target_image = self._load_template(image_path, window_info)
+            if target_image is None:
+                return None
 
             if self.debug_path:
                 capture_result.save(os.path.join(self.debug_path, f"region_{target.name}.png"))
-                target_image.save(os.path.join(self.debug_path, f"target_{target.name}.png"))
+                cv2.imwrite(os.path.join(self.debug_path, f"target_{target.name}.png"), target_image)
 
-            # Use PIL Image with pyautogui
+            # pyautogui matches with OpenCV, which takes the BGR arrays as is
             location = pyautogui.locate(
                 target_image,
-                capture_result.to_pil(),
+                capture_result.to_cv(),
                 confidence=target.confidence
             )
 
@@ -100,6 +107,80 @@ class ImageDetector:
         location = self.detect_image(target)
         return location is not None
 
+    def find_all_in_frame(self, frame: CaptureResult, targets: Dict[str, DetectableImage]) -> Dict[str, bool]:
+        """
+        Check several targets against one captured frame
+
+        Each target's region must lie within the frame's region. The frame is
+        converted once and every target is matched against its own slice of
+        it, so a single screen capture serves all targets.
+
+        Args:
+            frame: Capture covering the regions of all targets
+            targets: Targets to look for, keyed by a caller-chosen name
+
+        Returns:
+            Mapping from each key to whether its target was found
+        """
+        results = {key: False for key in targets}
+        try:
+            window_info = self.window_manager.get_window_info()
+            if not window_info:
+                logger.error("Failed to get window info")
+                return results
+
+            if self.debug_path:
+                frame.save(os.path.join(self.debug_path, "frame.png"))
+
+            for key, target in targets.items():
+                region_image = frame.crop(target.region)
+
+                template = self._load_template(target.image_path, window_info)
+                if (template is None
+                        or region_image.shape[0] < template.shape[0]
+                        or region_image.shape[1] < template.shape[1]):
+                    continue
+
+                match = cv2.matchTemplate(region_image, template, cv2.TM_CCOEFF_NORMED)
+                results[key] = float(match.max()) >= target.confidence
+        except Exception as e:
+            logger.error(f"Error detecting images in frame: {e}")
+
+        return results
+
+    def is_image_present_in(self, frame: CaptureResult, target: DetectableImage) -> bool:
+        """
+        Check if the target image is present in an already captured frame
+
+        Args:
+            frame: Capture covering the target's region
+            target: Target image to look for
+
+        Returns:
+            True if the target image is found in the frame, False otherwise
+        """
+        return self.find_all_in_frame(frame, {"target": target})["target"]
+
+    def _load_template(self, image_path: str, window_info: WindowInfo) -> Optional[np.ndarray]:
+        """
+        Load a target image scaled to the current window, caching the result
+
+        Args:
+            image_path: Path of the target image
+            window_info: Window information with scaling ratios
+
+        Returns:
+            Scaled template in BGR format, or None if the image cannot be loaded
+        """
+        key = (image_path, window_info.width_ratio, window_info.height_ratio)
+        if key not in self._template_cache:
+            template = None
+            if image_path and os.path.exists(image_path):
+                with Image.open(image_path) as target_image:
+                    template = ImageProcessor.pil_to_cv(self._scale_image(target_image, window_info))
+            self._template_cache[key] = template
+        return self._template_cache[key]
+
     @classmethod
     def _scale_image(cls, image: Image.Image, window_info: WindowInfo) -> Image.Image:
         """
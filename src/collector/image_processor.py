@@ -1,11 +1,38 @@
 import io
-from typing import Optional, Union
+import os
+from typing import List, Optional, Union
 
 import cv2
 import imagehash
 import numpy as np
 from PIL import Image
 
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def configure_opencv() -> None:
+    """
+    Configure OpenCV's optimized code paths and internal threading.
+
+    The images resized, converted and matched here are small crops, where
+    dispatching work to OpenCV's thread pool costs more than it saves, and
+    callers already match several images in parallel from Python threads.
+    OpenCV therefore runs single-threaded by default; its SIMD/IPP code paths
+    stay enabled. Set NIKKE_CV_THREADS to change the thread count (0 lets
+    OpenCV decide).
+
+    Called once by the application entry points at startup.
+    """
+    cv2.setUseOptimized(True)
+    try:
+        threads = int(os.environ.get('NIKKE_CV_THREADS', '1'))
+    except ValueError:
+        logger.warning(f"Ignoring invalid NIKKE_CV_THREADS value: {os.environ['NIKKE_CV_THREADS']}")
+        threads = 1
+    cv2.setNumThreads(threads)
+
 
 class ImageProcessor:
     """
@@ -24,12 +51,14 @@ class ImageProcessor:
         Returns:
             Image as numpy array in BGR format (OpenCV format)
         """
-        # Ensure image is in RGB mode
+        # RGBA can be converted straight to BGR; anything else goes through RGB
+        if pil_image.mode == 'RGBA':
+            return cv2.cvtColor(np.asarray(pil_image), cv2.COLOR_RGBA2BGR)
         if pil_image.mode != 'RGB':
             pil_image = pil_image.convert('RGB')
             
-        # Convert to numpy array (RGB format)
-        img_array = np.array(pil_image)
+        # View as numpy array (RGB format); cvtColor writes a new array anyway
+        img_array = np.asarray(pil_image)
         
         # Convert from RGB to BGR (OpenCV format)
         return cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
@@ -63,7 +92,12 @@ class ImageProcessor:
             Image as numpy array in BGR format (OpenCV format) or None if loading fails
         """
         try:
-            # Use PIL to open the image which better handles Unicode paths
+            # np.fromfile handles Unicode paths, and imdecode decodes straight to BGR
+            image = cv2.imdecode(np.fromfile(image_path, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if image is not None:
+                return image
+
+            # Fall back to PIL for formats OpenCV cannot decode
             with Image.open(image_path) as pil_img:
                 # Convert to OpenCV format
                 return ImageProcessor.pil_to_cv(pil_img)
@@ -88,36 +122,75 @@ class ImageProcessor:
         return image
     
     @staticmethod
-    def compute_image_hash(image: Union[str, np.ndarray, Image.Image]) -> str:
+    def compute_image_hash(image: Union[str, np.ndarray, Image.Image], hash_algorithm: str = 'dhash') -> int:
         """
-        Compute a perceptual hash for an image.
+        Compute a 64-bit perceptual hash for an image.
+
+        The default difference hash (dHash) shrinks the image to 9x8 grayscale
+        and records whether each pixel is brighter than its left neighbour, so
+        captures that differ only by noise or slight timing share the same hash.
+        'phash' uses the DCT-based hash from imagehash instead, which is slower
+        but more tolerant of color and contrast changes.
         
         Args:
             image: Input image as file path, OpenCV image (numpy array), or PIL Image
+            hash_algorithm: 'dhash' (default) or 'phash'
             
         Returns:
-            String hash representing the image
+            Hash as a 64-bit integer
         """
-        # Convert input to PIL Image
-        pil_img = None
-        
+        if hash_algorithm == 'dhash':
+            return ImageProcessor.compute_image_hashes([image])[0]
+        if hash_algorithm != 'phash':
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}. Must be 'dhash' or 'phash'")
+
         if isinstance(image, str):
-            # Load from file path
-            pil_img = Image.open(image)
+            with Image.open(image) as pil_img:
+                return int(str(imagehash.phash(pil_img)), 16)
         elif isinstance(image, np.ndarray):
-            # Convert from OpenCV to PIL format
-            if len(image.shape) == 3:
-                pil_img = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-            else:
-                pil_img = Image.fromarray(image)
+            pil_img = Image.fromarray(ImageProcessor.preprocess_image(image))
         elif isinstance(image, Image.Image):
             pil_img = image
         else:
             raise TypeError(f"Unsupported image type: {type(image)}. Must be str, np.ndarray, or PIL.Image.Image")
+        return int(str(imagehash.phash(pil_img)), 16)
+
+    @staticmethod
+    def compute_image_hashes(images: List[Union[str, np.ndarray, Image.Image]]) -> List[int]:
+        """
+        Compute the dHash of several images at once.
+
+        Each image is shrunk individually; the comparisons and bit packing
+        then run once over the whole stack.
         
-        # Compute perceptual hash (more robust to minor variations)
-        phash = str(imagehash.phash(pil_img))
-        return phash
+        Args:
+            images: Input images as file paths, OpenCV images (numpy arrays), or PIL Images
+            
+        Returns:
+            List of 64-bit hashes, in the same order as the input
+        """
+        if not images:
+            return []
+
+        thumbnails = np.empty((len(images), 8, 9), dtype=np.uint8)
+        for i, image in enumerate(images):
+            # Convert input to OpenCV format
+            if isinstance(image, str):
+                with Image.open(image) as pil_img:
+                    cv_img = ImageProcessor.pil_to_cv(pil_img)
+            elif isinstance(image, np.ndarray):
+                cv_img = image
+            elif isinstance(image, Image.Image):
+                cv_img = ImageProcessor.pil_to_cv(image)
+            else:
+                raise TypeError(f"Unsupported image type: {type(image)}. Must be str, np.ndarray, or PIL.Image.Image")
+
+            gray = ImageProcessor.preprocess_image(cv_img)
+            thumbnails[i] = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+
+        bits = thumbnails[:, :, 1:] > thumbnails[:, :, :-1]
+        packed = np.packbits(bits.reshape(len(images), 64), axis=1)
+        return [int.from_bytes(row.tobytes(), "big") for row in packed]
     
     @staticmethod
     def match_with_template(query_image: np.ndarray, template_image: np.ndarray) -> float:
@@ -140,11 +213,13 @@ class ImageProcessor:
         if query_h > template_h or query_w > template_w:
             scale = min(template_h / query_h, template_w / query_w)
             new_size = (int(query_w * scale), int(query_h * scale))
-            query_image = cv2.resize(query_image, new_size, interpolation=cv2.INTER_AREA)
+            query_image = cv2.resize(query_image, new_size,
+                                     interpolation=ImageProcessor.resize_interpolation(scale))
         elif template_h > query_h or template_w > query_w:
             scale = min(query_h / template_h, query_w / template_w)
             new_size = (int(template_w * scale), int(template_h * scale))
-            template_image = cv2.resize(template_image, new_size, interpolation=cv2.INTER_AREA)
+            template_image = cv2.resize(template_image, new_size,
+                                        interpolation=ImageProcessor.resize_interpolation(scale))
             
         # Perform template matching
         try:
@@ -157,12 +232,122 @@ class ImageProcessor:
             return 0.0
     
     @staticmethod
-    def image_to_blob(image: Union[str, np.ndarray, Image.Image]) -> bytes:
+    def resize_interpolation(scale: float) -> int:
+        """
+        Pick the interpolation for resizing an image before matching.
+        
+        Area averaging is only needed for strong downscales, where bilinear
+        sampling would skip pixels and alias; for milder ones bilinear gives
+        the same correlation scores at a lower cost.
+        
+        Args:
+            scale: Output size divided by input size
+            
+        Returns:
+            OpenCV interpolation flag
+        """
+        return cv2.INTER_AREA if scale < 0.5 else cv2.INTER_LINEAR
+    
+    @staticmethod
+    def shrink(image: np.ndarray, factor: int) -> np.ndarray:
+        """
+        Downscale an image by an integer factor using area averaging.
+        
+        Args:
+            image: OpenCV image (numpy array)
+            factor: Divisor applied to both dimensions
+            
+        Returns:
+            Downscaled image, or the input itself if factor is 1
+        """
+        if factor <= 1:
+            return image
+        height, width = image.shape[:2]
+        size = (max(width // factor, 1), max(height // factor, 1))
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    
+    @staticmethod
+    def normalize_templates(templates: np.ndarray) -> np.ndarray:
+        """
+        Prepare a stack of same-sized templates for batched matching.
+        
+        Args:
+            templates: Preprocessed templates with shape (N, H, W)
+            
+        Returns:
+            Float32 array of shape (N, H*W) whose rows have zero mean and unit norm
+        """
+        flat = templates.reshape(len(templates), -1).astype(np.float32)
+        flat -= flat.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(flat, axis=1, keepdims=True)
+        # Flat templates have no structure to correlate with; leave them at zero
+        norms[norms == 0] = 1.0
+        flat /= norms
+        return flat
+    
+    @staticmethod
+    def match_batch(query_image: np.ndarray, templates: np.ndarray, template_shape: tuple) -> np.ndarray:
+        """
+        Match a query image against a stack of same-sized templates at once.
+        
+        The query is resized to the template size and compared with each
+        template using the normalized correlation coefficient, which is what
+        TM_CCOEFF_NORMED yields when image and template have the same size.
+        
+        Args:
+            query_image: The image to match (preprocessed)
+            templates: Templates prepared with normalize_templates
+            template_shape: (height, width) of the templates
+            
+        Returns:
+            Array of similarity scores, one per template
+        """
+        return templates @ ImageProcessor.prepare_query(query_image, template_shape)
+
+    @staticmethod
+    def prepare_query(query_image: np.ndarray, template_shape: tuple) -> np.ndarray:
+        """
+        Resize and normalize a query image for comparison with prepared templates.
+        
+        The dot product of the result with a row from normalize_templates is
+        the similarity score of the query against that template. The query
+        keeps its aspect ratio: it is scaled to cover the template size and
+        the overhang is cropped evenly from both sides, so a query shaped
+        differently from the references is not stretched.
+        
+        Args:
+            query_image: The image to match (preprocessed)
+            template_shape: (height, width) of the templates
+            
+        Returns:
+            Float32 vector of length H*W with zero mean and unit norm
+        """
+        height, width = template_shape
+        query_h, query_w = query_image.shape[:2]
+        scale = max(height / query_h, width / query_w)
+        size = (max(width, round(query_w * scale)), max(height, round(query_h * scale)))
+        if size[0] - width <= 1 and size[1] - height <= 1:
+            # Off by rounding only; resizing straight to the template size
+            # distorts the query by less than a pixel
+            size = (width, height)
+        resized = cv2.resize(query_image, size, interpolation=ImageProcessor.resize_interpolation(scale))
+        top = (size[1] - height) // 2
+        left = (size[0] - width) // 2
+        resized = resized[top:top + height, left:left + width]
+        return ImageProcessor.normalize_templates(resized[np.newaxis])[0]
+    
+    @staticmethod
+    def image_to_blob(image: Union[str, np.ndarray, Image.Image], fmt: str = 'png') -> bytes:
         """
         Convert an image to binary blob data for storage.
         
+        In-memory images are encoded with OpenCV. PNG uses zlib level 1, which
+        is much faster than the default for a slightly larger file; JPEG can
+        be used for decorative images where exact pixels do not matter.
+        
         Args:
             image: Input image as file path, OpenCV image, or PIL Image
+            fmt: 'png' (default, lossless) or 'jpeg'; ignored for file paths
             
         Returns:
             Binary blob data
@@ -171,19 +356,34 @@ class ImageProcessor:
             # Load from file path
             with open(image, 'rb') as f:
                 return f.read()
-        elif isinstance(image, np.ndarray):
-            # Convert OpenCV image to binary
-            is_success, buffer = cv2.imencode('.png', image)
-            if not is_success:
-                raise ValueError("Failed to encode OpenCV image")
-            return buffer.tobytes()
+
+        if fmt == 'png':
+            extension, params = '.png', [cv2.IMWRITE_PNG_COMPRESSION, 1]
+        elif fmt == 'jpeg':
+            extension, params = '.jpg', [cv2.IMWRITE_JPEG_QUALITY, 85]
+        else:
+            raise ValueError(f"Unsupported format: {fmt}. Must be 'png' or 'jpeg'")
+
+        if isinstance(image, np.ndarray):
+            cv_image = image
         elif isinstance(image, Image.Image):
-            # Convert PIL image to binary
-            buffer = io.BytesIO()
-            image.save(buffer, format='PNG')
-            return buffer.getvalue()
+            # Keep the alpha channel for PNG; everything else becomes BGR
+            if image.mode == 'RGBA' and fmt == 'png':
+                cv_image = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGBA2BGRA)
+            elif image.mode == 'L':
+                cv_image = np.asarray(image)
+            else:
+                cv_image = ImageProcessor.pil_to_cv(image)
         else:
             raise TypeError(f"Unsupported image type: {type(image)}. Must be str, np.ndarray, or PIL.Image.Image")
+
+        if fmt == 'jpeg' and cv_image.ndim == 3 and cv_image.shape[2] == 4:
+            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_BGRA2BGR)
+
+        is_success, buffer = cv2.imencode(extension, cv_image, params)
+        if not is_success:
+            raise ValueError("Failed to encode image")
+        return buffer.tobytes()
     
     @staticmethod
     def blob_to_cv_image(blob_data: bytes) -> np.ndarray:
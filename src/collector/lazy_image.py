@@ -0,0 +1,69 @@
+"""
+Lazy Image
+
+Keeps captured screenshots PNG-compressed in memory and decodes them only
+when their pixels are needed, so collecting many users does not pin every
+decoded capture in RAM.
+"""
+import io
+from typing import Union
+
+import numpy as np
+from PIL import Image
+
+from .image_processor import ImageProcessor
+
+
+class LazyImage:
+    """
+    An image held as compressed PNG data.
+
+    Saving writes the stored PNG data directly; the pil property decodes a
+    fresh PIL image on each access, which the caller can drop once done.
+    """
+
+    __slots__ = ('_data', 'width', 'height')
+
+    def __init__(self, source: Union[bytes, Image.Image, np.ndarray]):
+        """
+        Args:
+            source: PIL image or OpenCV (BGR) image to compress, or PNG data
+        """
+        if isinstance(source, Image.Image):
+            self._data = ImageProcessor.image_to_blob(source)
+            self.width, self.height = source.size
+        elif isinstance(source, np.ndarray):
+            self._data = ImageProcessor.image_to_blob(source)
+            self.height, self.width = source.shape[:2]
+        else:
+            self._data = bytes(source)
+            with Image.open(io.BytesIO(self._data)) as image:
+                self.width, self.height = image.size
+
+    @property
+    def pil(self) -> Image.Image:
+        """Decode the image"""
+        image = Image.open(io.BytesIO(self._data))
+        image.load()
+        return image
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def to_bytes(self) -> bytes:
+        """Get the PNG data"""
+        return self._data
+
+    def save(self, filename: str) -> None:
+        """
+        Save the image as PNG without decoding it.
+
+        Args:
+            filename: Output file path
+        """
+        with open(filename, 'wb') as f:
+            f.write(self._data)
+
+    def __repr__(self) -> str:
+        return f"LazyImage({self.width}x{self.height}, {len(self._data)} bytes)"
@@ -1,15 +1,20 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
+import numpy as np
 from PIL import Image
 
 from collector.profile_collector import ProfileCollector
 from domain.character import Character
 from .character_matcher import CharacterMatcher
+from .image_processor import ImageProcessor
+from .lazy_image import LazyImage
 from .logging_config import get_logger
 from .models import Round, User
 from .mouse_control import MouseController
 from .ui_def import TEAM_INFO
-from .window_capturer import WindowCapturer
+from .window_capturer import CaptureResult, WindowCapturer
 
 logger = get_logger(__name__)
 
@@ -23,11 +28,42 @@ class LineupProcessor:
         self.matcher = matcher
 
     def process(self) -> User:
+        # The delay after closing the detail view overlaps with the analysis
+        user = self.analyze(self.capture())
+        self.controller.wait_for_delay()
+        return user
+
+    def capture(self) -> User:
+        """
+        Click through the user's profile and rounds and capture the raw images.
+
+        Touches the game window, so calls must not overlap.
+
+        Returns:
+            User with round and character images but no recognized characters
+        """
         self.controller.click_at_position(TEAM_INFO.avatar)
         logger.info(f"Clicked on avatar button to view profile")
         user = self.profile_collector.collect()
         self._capture_user_rounds(user)
-        user.team_image = self.combine_round_images([_round.image for _round in user.rounds.values()])
+        return user
+
+    def analyze(self, user: User) -> User:
+        """
+        Recognize characters and build the team image from captured images.
+
+        Does not touch the game window, so it may run on a worker thread.
+
+        Args:
+            user: User returned by capture()
+
+        Returns:
+            The same user, completed
+        """
+        for _round in user.rounds.values():
+            self._match_characters(_round)
+        team_image = self.combine_round_images([_round.image.pil for _round in user.rounds.values()])
+        user.team_image = LazyImage(team_image) if team_image else None
         return user
 
     def _capture_user_rounds(self, user: User):
@@ -37,40 +73,53 @@ class LineupProcessor:
                 self.controller.click_at_position(round_pos)
                 logger.info(f"Clicked on round {round_index} button")
                 capture_result = self.capturer.capture_region(TEAM_INFO.round_region)
-                _round = Round(round_index=round_index, image=capture_result.to_pil())
-                self._capture_character_images(_round)
+                _round = Round(round_index=round_index, image=LazyImage(capture_result.to_cv()))
+                self._capture_character_images(_round, capture_result)
                 user.add_round(_round)
 
             # After capturing all rounds, click somewhere else to close the detail view
-            self.controller.click_at_position(TEAM_INFO.close)
+            self.controller.click_at_position(TEAM_INFO.close, defer_delay=True)
             logger.info("Clicked close button to exit detail view")
 
 
         except Exception as e:
             logger.error(f"Error capturing rounds for user {user.user_id}: {e}")
 
-    def _capture_character_images(self, _round: Round):
+    def _capture_character_images(self, _round: Round, round_capture: CaptureResult):
         try:
             for position_idx in range(5):
-                # Directly capture from screen
-                capture_result = self.capturer.capture_region(TEAM_INFO.get_character_region(position_idx+1))
-                if capture_result:
-                    logger.debug(f"Captured character at position {position_idx + 1} in round {_round.round_index}")
+                # The character slots lie within the round region, so cut them
+                # out of the round capture rather than grabbing the screen again
+                character_image = round_capture.crop(TEAM_INFO.get_character_region(position_idx+1))
+                if character_image.size:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Captured character at position {position_idx + 1} in round {_round.round_index}")
                 else:
                     logger.error(
                         f"Failed to capture character at position {position_idx + 1} in round {_round.round_index}")
                     return
-                character_image = capture_result.to_pil()
-                character = Character(position=position_idx + 1, image=character_image)
-                if self.matcher:
-                    match_result = self.matcher.match(character_image)
-                    if match_result.has_match:
-                        character.id = match_result.character.id
-                        character.name = match_result.character.name
+                character = Character(position=position_idx + 1, image=ImageProcessor.cv_to_pil(character_image))
                 _round.add_character(character)
         except Exception as e:
             logger.error(f"Error capturing character images for round {_round.round_index}: {e}")
 
+    def _match_characters(self, _round: Round):
+        if not self.matcher:
+            return
+        try:
+            # Match the round's characters in parallel, then apply the results here.
+            # The matcher only needs grayscale, which PIL produces in one pass.
+            characters = list(_round.characters.values())
+            query_images = [np.asarray(c.image.convert('L')) for c in characters]
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                match_results = list(executor.map(self.matcher.match, query_images))
+            for character, match_result in zip(characters, match_results):
+                if match_result.has_match:
+                    character.id = match_result.character.id
+                    character.name = match_result.character.name
+        except Exception as e:
+            logger.error(f"Error matching characters for round {_round.round_index}: {e}")
+
     @classmethod
     def combine_round_images(cls, round_images: List[Image.Image]) -> Optional[Image.Image]:
         """
@@ -3,10 +3,11 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Annotated, Dict, List, Optional
 
-from PIL import Image
 from dataclass_wizard import JSONPyWizard, JSONWizard, json_key
 
 from domain.character import Character
+from .file_utils import ensure_dir
+from .lazy_image import LazyImage
 from mixin.json import JSONSerializableMixin
 
 
@@ -20,13 +21,13 @@ class ServerRegion(Enum):
     HK_MO_TW = "hk_mo_tw"  # Hong Kong/Macau/Taiwan Server
 
 
-@dataclass
+@dataclass(slots=True)
 class Round(JSONWizard, JSONSerializableMixin):
     class _(JSONPyWizard.Meta):
         skip_defaults = True
 
     round_index: int
-    image: Annotated[Optional[Image.Image], json_key("excluded", dump=False)] = None
+    image: Annotated[Optional[LazyImage], json_key("excluded", dump=False)] = None
     characters: Dict[int, Character] = field(default_factory=dict)
 
     def add_character(self, character: Character) -> None:
@@ -41,7 +42,7 @@ class Round(JSONWizard, JSONSerializableMixin):
             output_dir: Directory where character images will be saved
         """
         # Create directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
 
         # Save each character image
         for position, character in self.characters.items():
@@ -56,7 +57,7 @@ class Round(JSONWizard, JSONSerializableMixin):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class User(JSONWizard, JSONSerializableMixin):
     class _(JSONPyWizard.Meta):
         skip_defaults = True
@@ -65,8 +66,8 @@ class User(JSONWizard, JSONSerializableMixin):
     group_id: int = None
     player_index: int = None
     server_region: Optional[ServerRegion] = None
-    profile_image: Annotated[Optional[Image.Image], json_key("excluded", dump=False)] = None
-    team_image: Annotated[Optional[Image.Image], json_key("excluded", dump=False)] = None
+    profile_image: Annotated[Optional[LazyImage], json_key("excluded", dump=False)] = None
+    team_image: Annotated[Optional[LazyImage], json_key("excluded", dump=False)] = None
     rounds: Dict[int, Round] = field(default_factory=dict)
 
     def add_round(self, round_obj: Round) -> None:
@@ -84,7 +85,7 @@ class User(JSONWizard, JSONSerializableMixin):
         if not self.profile_image:
             return
         # Create directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
         # Save the user's profile image
         file_path = os.path.join(output_dir, f"{prefix + '_' if prefix else ''}user_{self.user_id}_profile.png")
         self.profile_image.save(file_path)
@@ -100,23 +101,23 @@ class User(JSONWizard, JSONSerializableMixin):
         if not self.team_image:
             return
         # Create directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
         # Save the user's image
         file_path = os.path.join(output_dir, f"{prefix + '_' if prefix else ''}user_{self.user_id}_team.png")
         self.team_image.save(file_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class Group(JSONWizard, JSONSerializableMixin):
     class _(JSONPyWizard.Meta):
         skip_defaults = True
 
     users: List[User]
-    combined_image: Annotated[Optional[Image.Image], json_key("excluded", dump=False)] = None
-    result_image: Annotated[Optional[Image.Image], json_key("excluded", dump=False)] = None
+    combined_image: Annotated[Optional[LazyImage], json_key("excluded", dump=False)] = None
+    result_image: Annotated[Optional[LazyImage], json_key("excluded", dump=False)] = None
 
     @staticmethod
-    def _save_image(image: Image.Image, save_path: str):
+    def _save_image(image: LazyImage, save_path: str):
         """
         Save an image to a file.
         """
@@ -124,8 +125,8 @@ class Group(JSONWizard, JSONSerializableMixin):
             raise ValueError("No image to save")
         # Ensure save directory exists
         save_dir = os.path.dirname(save_path)
-        if save_dir and not os.path.exists(save_dir):
-            os.makedirs(save_dir, exist_ok=True)
+        if save_dir:
+            ensure_dir(save_dir)
         image.save(save_path)
 
     def save_result_image(self, save_path: str):
@@ -170,7 +171,7 @@ class TournamentStage(Enum):
     STAGE_2_1 = "2->1"
 
 
-@dataclass
+@dataclass(slots=True)
 class BattleData(JSONWizard, JSONSerializableMixin):
     class _(JSONPyWizard.Meta):
         skip_defaults = True
@@ -179,9 +180,9 @@ class BattleData(JSONWizard, JSONSerializableMixin):
     left_user_id: Optional[str] = None
     right_user_id: Optional[str] = None
     result: list[BattleResult] = field(default_factory=list)
-    image: Annotated[Optional[Image.Image], json_key("excluded", dump=False)] = None
+    image: Annotated[Optional[LazyImage], json_key("excluded", dump=False)] = None
 
     def save_image(self, save_path: str) -> None:
         if self.image:
-            os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else '.', exist_ok=True)
+            ensure_dir(os.path.dirname(save_path) or '.')
             self.image.save(save_path)
@@ -71,7 +71,12 @@ class MouseController:
             logger.error(f"Error preparing position: {e}")
             return None
 
-    def click_at_position(self, x: Union[int, Position], y: Optional[int] = None, button: str = 'left', delay:float = None) -> bool:
+    def wait_for_delay(self) -> None:
+        """Block until any delay started by a deferred click has elapsed."""
+        self.delay_manager.wait()
+
+    def click_at_position(self, x: Union[int, Position], y: Optional[int] = None, button: str = 'left',
+                          delay: float = None, defer_delay: bool = False) -> bool:
         """
         Click on a position based on standard coordinates (3580x2014).
 
@@ -80,10 +85,15 @@ class MouseController:
             y: Y coordinate in standard window size (not needed if x is a Position)
             button (str): Mouse button to click ('left', 'right', 'middle')
             delay (float): Delay in seconds to wait after clicking
+            defer_delay (bool): Start the random delay without waiting for it. The next
+                mouse action, or wait_for_delay(), blocks for whatever is left of it.
         Returns:
             bool: True if successful, False otherwise
         """
         try:
+            # Let a deferred delay from the previous click run out first
+            self.delay_manager.wait()
+
             result = self._prepare_position(x, y)
             if not result:
                 return False
@@ -96,6 +106,8 @@ class MouseController:
                 f"Clicked at standard position ({standard_x}, {standard_y}) => screen position ({abs_x}, {abs_y})")
             if delay is not None:
                 time.sleep(delay)
+            elif defer_delay:
+                self.delay_manager.begin_delay()
             else:
                 self.delay_manager.sleep()
             return True
@@ -116,6 +128,8 @@ class MouseController:
             bool: True if successful, False otherwise
         """
         try:
+            self.delay_manager.wait()
+
             result = self._prepare_position(x, y)
             if not result:
                 return False
@@ -150,6 +164,8 @@ class MouseController:
             bool: True if all clicks successful, False otherwise
         """
         try:
+            self.delay_manager.wait()
+
             window_info = self.get_window_info()
 
             if not window_info:
@@ -1,16 +1,40 @@
+import json
+import logging
 import os
+import random
+import threading
 import time
+import uuid
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 # For OBS Websocket
 import obsws_python as obs
+from obsws_python.error import OBSSDKError, OBSSDKTimeoutError
 
+from .file_utils import ensure_dir
 from .logging_config import get_logger
 from .window_manager import WindowManager
 
 logger = get_logger(__name__)
 
+# obs-websocket v5 RequestBatch execution type running requests one after another
+BATCH_SERIAL_REALTIME = 0
+
+# Reconnect backoff: the n-th retry waits a random time up to min(cap, base * 2**n) seconds
+CONNECT_MAX_ATTEMPTS = 7
+CONNECT_BACKOFF_BASE = 1.0
+CONNECT_BACKOFF_CAP = 30.0
+
+# Seconds a known recording state is trusted before asking OBS again
+RECORD_STATE_TTL = 1.0
+
+# Open connections shared by all controllers, keyed by (host, port). Each
+# comes with a lock held around every request/response pair on it, since the
+# websocket replies in order and obsws-python does not serialize callers
+_clients: Dict[Tuple[str, int], Tuple[obs.ReqClient, threading.Lock]] = {}
+_clients_lock = threading.Lock()
+
 
 @dataclass
 class OBSInfo:
@@ -34,45 +58,176 @@ class OBSController:
         self.window_manager = window_manager
         self.obs_info = obs_info
         self.client: Optional[obs.ReqClient] = None
+        # Request lock of the shared connection in self.client
+        self._client_lock: Optional[threading.Lock] = None
         self.current_output_file: Optional[str] = None
         self.is_connected = False
         self.scene_name = scene_name
+        # Last known recording state and when it was learned
+        self._recording: Optional[bool] = None
+        self._recording_time = 0.0
 
-    def connect(self) -> bool:
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Leave the shared connection open for the next user
+        self.disconnect()
+
+    def connect(self, max_attempts: int = CONNECT_MAX_ATTEMPTS) -> bool:
         """
         Connect to OBS Studio via websocket.
 
+        Connections are shared per host and port and stay open between uses,
+        so this only opens a new one if there is none yet or the existing one
+        no longer answers. If OBS cannot be reached, connecting is retried with
+        exponential backoff and jitter; rejected authentication is not retried.
+
+        Args:
+            max_attempts: Maximum number of connection attempts
+
         Returns:
             bool: True if connection successful, False otherwise
         """
-        try:
-            logger.info(f"Connecting to OBS at {self.obs_info.host}:{self.obs_info.port}")
-            self.client = obs.ReqClient(
-                host=self.obs_info.host,
-                port=self.obs_info.port,
-                password=self.obs_info.password,
-                timeout=self.obs_info.timeout,
-            )
-
-            # Test connection
-            version = self.client.get_version()
-            logger.info(f"Connected to OBS Studio {version.obs_version}")
-            self.is_connected = True
-            return True
+        key = (self.obs_info.host, self.obs_info.port)
+        # The lock only guards the pool; pinging, connecting and backing off
+        # happen outside it so controllers for other servers are not held up
+        with _clients_lock:
+            pooled = _clients.get(key)
+        if pooled is not None:
+            client, lock = pooled
+            try:
+                # Make sure the connection is still alive
+                with lock:
+                    client.get_version()
+                self.client, self._client_lock = pooled
+                self.is_connected = True
+                return True
+            except Exception as e:
+                logger.warning(f"Lost connection to OBS, reconnecting: {e}")
+                with _clients_lock:
+                    if _clients.get(key) is pooled:
+                        del _clients[key]
+                with lock:
+                    self._close(client)
+
+        self.client = None
+        self._client_lock = None
+        self.is_connected = False
+        for attempt in range(max_attempts):
+            if attempt:
+                delay = random.random() * min(CONNECT_BACKOFF_CAP, CONNECT_BACKOFF_BASE * 2 ** (attempt - 1))
+                logger.info(f"Retrying OBS connection in {delay:.1f}s")
+                time.sleep(delay)
+            try:
+                logger.info(f"Connecting to OBS at {self.obs_info.host}:{self.obs_info.port}")
+                client = obs.ReqClient(
+                    host=self.obs_info.host,
+                    port=self.obs_info.port,
+                    password=self.obs_info.password,
+                    timeout=self.obs_info.timeout,
+                )
 
-        except Exception as e:
-            logger.error(f"Error connecting to OBS: {e}")
-            self.client = None
-            self.is_connected = False
-            return False
+                # Test connection
+                version = client.get_version()
+                logger.info(f"Connected to OBS Studio {version.obs_version}")
+                with _clients_lock:
+                    # Another controller may have connected in the meantime
+                    shared = _clients.setdefault(key, (client, threading.Lock()))
+                if shared[0] is not client:
+                    self._close(client)
+                self.client, self._client_lock = shared
+                self.is_connected = True
+                return True
+
+            except OBSSDKError as e:
+                if not isinstance(e, OBSSDKTimeoutError):
+                    # OBS is running but refused us, e.g. a wrong password
+                    logger.error(f"OBS rejected the connection: {e}")
+                    return False
+                logger.warning(f"Error connecting to OBS: {e}")
+            except Exception as e:
+                logger.warning(f"Error connecting to OBS: {e}")
+
+        logger.error(f"Could not connect to OBS after {max_attempts} attempts")
+        return False
+
+    def disconnect(self, force: bool = False) -> None:
+        """
+        Disconnect from OBS Studio websocket.
 
-    def disconnect(self) -> None:
-        """Disconnect from OBS Studio websocket."""
+        Args:
+            force: Also close the shared connection instead of keeping it open
+                for the next connect()
+        """
         if self.client:
-            logger.info("Disconnecting from OBS")
+            if force:
+                logger.info("Disconnecting from OBS")
+                with _clients_lock:
+                    key = (self.obs_info.host, self.obs_info.port)
+                    pooled = _clients.get(key)
+                    if pooled is not None and pooled[0] is self.client:
+                        del _clients[key]
+                with self._client_lock:
+                    self._close(self.client)
             self.client = None
+            self._client_lock = None
             self.is_connected = False
 
+    @staticmethod
+    def _close(client: obs.ReqClient) -> None:
+        """Close a websocket connection, ignoring errors from a dead socket"""
+        try:
+            client.disconnect()
+        except Exception:
+            pass
+
+    def _send_batch(self, requests: List[Tuple[str, Optional[dict]]], halt_on_failure: bool = False) -> List[dict]:
+        """
+        Send several requests to OBS in a single round trip.
+
+        obsws-python only sends single requests, so the RequestBatch message is
+        written to the client's websocket directly, the same way ReqClient does
+        for one request. The requests run in order.
+
+        Args:
+            requests: (request type, request data) pairs
+            halt_on_failure: Skip the remaining requests once one fails
+
+        Returns:
+            One result per executed request, with "requestType", "requestStatus"
+            and, if the request returns data, "responseData"
+        """
+        payload = {
+            "op": 8,
+            "d": {
+                "requestId": uuid.uuid4().hex,
+                "haltOnFailure": halt_on_failure,
+                "executionType": BATCH_SERIAL_REALTIME,
+                "requests": [
+                    {"requestType": request_type, "requestData": request_data or {}}
+                    for request_type, request_data in requests
+                ],
+            },
+        }
+        ws = self.client.base_client.ws
+        with self._client_lock:
+            ws.send(json.dumps(payload))
+            response = ws.recv()
+        return json.loads(response)["d"]["results"]
+
+    @staticmethod
+    def _succeeded(result: dict) -> bool:
+        """Check whether a batched request succeeded"""
+        return result["requestStatus"]["result"]
+
+    @staticmethod
+    def _failure(result: dict) -> str:
+        """Describe why a batched request failed"""
+        status = result["requestStatus"]
+        return f"{result['requestType']} failed with code {status['code']}: {status.get('comment')}"
+
     def setup_window_capture(self, input_name: str = "NIKKE") -> bool:
         """
         Create or update a window capture source in OBS.
@@ -94,51 +249,36 @@ class OBSController:
                 logger.error("Failed to get window information")
                 return False
 
-            # 1. Check and create scene if needed
-            scenes = self.client.get_scene_list()
-            scene_exists = False
-
-            # Check if scene exists in OBS
-            for scene in scenes.scenes:
-                if isinstance(scene, dict) and 'sceneName' in scene:
-                    if scene['sceneName'] == self.scene_name:
-                        scene_exists = True
-                        break
-                elif hasattr(scene, 'scene_name') and scene.scene_name == self.scene_name:
-                    scene_exists = True
-                    break
-
-            # Create the scene if it doesn't exist
-            if not scene_exists:
-                logger.info(f"Creating scene '{self.scene_name}'")
-                self.client.create_scene(self.scene_name)
-
-            # 2. Remove existing input if it exists
-            try:
-                self.client.remove_input(name=input_name)
-                logger.info(f"Removed existing source '{input_name}'")
-            except Exception:
-                # Source might not exist, that's fine
-                pass
-
-            # 3. Create the window capture source
-            logger.info(f"Creating window capture source '{input_name}'")
-
             # Create source settings
             source_settings = {
                 "window": self.window_manager.process_name,
                 "capture_window_title": True,
             }
 
-            # Create the input using proper parameter names for OBS WebSocket
-            # Based on the error, we use proper parameter names
-            self.client.create_input(
-                sceneName=self.scene_name,
-                inputName=input_name,
-                inputKind="window_capture",
-                inputSettings=source_settings,
-                sceneItemEnabled=True
-            )
+            # Send everything as one batch without halting on failure:
+            # 1. Create the scene; this fails harmlessly if it already exists
+            # 2. Remove the existing input; this fails harmlessly if there is none
+            # 3. Create the window capture source
+            logger.info(f"Creating window capture source '{input_name}' in scene '{self.scene_name}'")
+            scene_result, remove_result, create_result = self._send_batch([
+                ("CreateScene", {"sceneName": self.scene_name}),
+                ("RemoveInput", {"inputName": input_name}),
+                ("CreateInput", {
+                    "sceneName": self.scene_name,
+                    "inputName": input_name,
+                    "inputKind": "window_capture",
+                    "inputSettings": source_settings,
+                    "sceneItemEnabled": True,
+                }),
+            ])
+
+            if self._succeeded(scene_result):
+                logger.info(f"Created scene '{self.scene_name}'")
+            if self._succeeded(remove_result):
+                logger.info(f"Removed existing source '{input_name}'")
+            if not self._succeeded(create_result):
+                logger.error(f"Error setting up window capture: {self._failure(create_result)}")
+                return False
 
             logger.info(f"Window capture source '{input_name}' configured successfully")
             return True
@@ -167,50 +307,58 @@ class OBSController:
             return False
 
         try:
-            profile_list = self.client.get_profile_list()
-            profiles = profile_list.profiles
-            logger.info(f"Available profiles: {profile_list.profiles}")
+            # Configure the output and start recording in one batch. The
+            # profile list is only fetched for the debug log
+            list_profiles = logger.isEnabledFor(logging.DEBUG)
+            requests = [("GetProfileList", None)] if list_profiles else []
             # Prepare output path if filename is specified
             if filename:
-                if not os.path.exists(output_dir):
-                    os.makedirs(output_dir, exist_ok=True)
+                ensure_dir(output_dir)
                 output_path = os.path.join(output_dir, filename)
 
                 # Try to configure output settings
                 logger.info(f"Setting recording output path to {output_dir}")
-                self.client.set_profile_parameter(
-                    category="Output",
-                    name="RecFilePath",
-                    value=output_dir
-                )
-
                 # Set filename without extension (OBS adds it)
                 base_filename = os.path.splitext(filename)[0]
-                self.client.set_profile_parameter(
-                    category="Output",
-                    name="RecFormat",
-                    value=base_filename
-                )
+                requests += [
+                    ("SetProfileParameter", {"parameterCategory": "Output", "parameterName": "RecFilePath",
+                                             "parameterValue": output_dir}),
+                    ("SetProfileParameter", {"parameterCategory": "Output", "parameterName": "RecFormat",
+                                             "parameterValue": base_filename}),
+                ]
+            else:
+                # Get current recording path from OBS
+                requests.append(("GetProfileParameter", {"parameterCategory": "Output",
+                                                         "parameterName": "RecFilePath"}))
+            requests.append(("StartRecord", None))
+
+            # Don't start recording if the output settings could not be applied
+            logger.info("Starting OBS recording")
+            results = self._send_batch(requests, halt_on_failure=bool(filename))
+
+            if list_profiles:
+                profile_result = results[0]
+                if self._succeeded(profile_result):
+                    logger.debug(f"Available profiles: {profile_result['responseData']['profiles']}")
 
+            if filename:
                 self.current_output_file = output_path
             else:
-                # Get current recording path from OBS
-                try:
-                    rec_path = self.client.get_profile_parameter(
-                        category="Output",
-                        name="RecFilePath"
-                    )
-                    timestamp = time.strftime("%Y%m%d_%H%M%S")
-                    rec_dir = rec_path.value if hasattr(rec_path, 'value') else "."
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                rec_path = results[1 if list_profiles else 0]
+                if self._succeeded(rec_path):
+                    rec_dir = rec_path["responseData"].get("parameterValue") or "."
                     self.current_output_file = os.path.join(rec_dir, f"recording_{timestamp}.mp4")
-                except Exception:
+                else:
                     # Use default path if we can't get the current path
-                    timestamp = time.strftime("%Y%m%d_%H%M%S")
                     self.current_output_file = f"recording_{timestamp}.mp4"
 
-            # Start recording
-            logger.info("Starting OBS recording")
-            self.client.start_record()
+            start_result = results[-1]
+            if not self._succeeded(start_result):
+                logger.error(f"Error starting recording: {self._failure(start_result)}")
+                return False
+
+            self._set_recording(True)
             logger.info(f"Recording started. Output will be saved to {self.current_output_file}")
             return True
 
@@ -235,16 +383,14 @@ class OBSController:
 
         try:
             logger.info("Stopping OBS recording")
-            result = self.client.stop_record()
+            with self._client_lock:
+                result = self.client.stop_record()
 
-            # Get output path from result if available
-            if hasattr(result, 'outputPath'):
-                self.current_output_file = result.outputPath
-            elif hasattr(result, 'output_path'):
+            # obs-websocket v5 returns the output path; obsws-python snake-cases it
+            if result is not None:
                 self.current_output_file = result.output_path
-            elif hasattr(result, 'path'):
-                self.current_output_file = result.path
 
+            self._set_recording(False)
             logger.info(f"Recording stopped: {self.current_output_file}")
             return True
 
@@ -252,19 +398,32 @@ class OBSController:
             logger.error(f"Error stopping recording: {e}")
             return False
 
+    def _set_recording(self, recording: bool) -> None:
+        """Remember the recording state"""
+        self._recording = recording
+        self._recording_time = time.monotonic()
+
     def is_recording(self) -> bool:
         """
         Check if recording is in progress.
 
+        A state learned within the last RECORD_STATE_TTL seconds, e.g. from
+        starting or stopping a recording, is returned without asking OBS.
+
         Returns:
             bool: True if recording is in progress, False otherwise
         """
         if not self.is_connected or not self.client:
             return False
 
+        if self._recording is not None and time.monotonic() - self._recording_time < RECORD_STATE_TTL:
+            return self._recording
+
         try:
-            status = self.client.get_record_status()
-            return status.active if hasattr(status, 'active') else False
+            with self._client_lock:
+                status = self.client.get_record_status()
+            self._set_recording(status.active if hasattr(status, 'active') else False)
+            return self._recording
         except Exception:
             return False
 
@@ -294,7 +453,8 @@ class OBSController:
 
         try:
             logger.info("Starting OBS streaming")
-            self.client.start_stream()
+            with self._client_lock:
+                self.client.start_stream()
             logger.info("Streaming started")
             return True
 
@@ -319,7 +479,8 @@ class OBSController:
 
         try:
             logger.info("Stopping OBS streaming")
-            self.client.stop_stream()
+            with self._client_lock:
+                self.client.stop_stream()
             logger.info("Streaming stopped")
             return True
 
@@ -338,7 +499,8 @@ class OBSController:
             return False
 
         try:
-            status = self.client.get_stream_status()
+            with self._client_lock:
+                status = self.client.get_stream_status()
             return status.active if hasattr(status, 'active') else False
         except Exception:
             return False
@@ -364,20 +526,21 @@ class OBSController:
         try:
             # Ensure directory exists
             directory = os.path.dirname(output_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory, exist_ok=True)
+            if directory:
+                ensure_dir(directory)
 
             logger.info(f"Taking screenshot with OBS, saving to {output_path}")
 
             # Take screenshot of the source using proper parameter names
-            self.client.save_source_screenshot(
-                sourceName=source_name,
-                imageFormat="png",
-                imageFilePath=output_path,
-                imageWidth=width,
-                imageHeight=height,
-                imageCompressionQuality=100
-            )
+            with self._client_lock:
+                self.client.save_source_screenshot(
+                    sourceName=source_name,
+                    imageFormat="png",
+                    imageFilePath=output_path,
+                    imageWidth=width,
+                    imageHeight=height,
+                    imageCompressionQuality=100
+                )
 
             logger.info(f"Screenshot saved to {output_path}")
             return True
@@ -2,8 +2,8 @@
 from typing import Optional
 
 import pyperclip
-from PIL import Image
 
+from .lazy_image import LazyImage
 from .logging_config import get_logger
 from .models import User
 from .mouse_control import MouseController
@@ -26,6 +26,6 @@ class ProfileCollector:
         self.controller.click_at_position(PROFILE.close)
         return user
 
-    def _capture_user_image(self)->Optional[Image.Image]:
+    def _capture_user_image(self)->Optional[LazyImage]:
         capture_result = self.capturer.capture_region(PROFILE.profile_region)
-        return capture_result.to_pil()
+        return LazyImage(capture_result.to_cv())
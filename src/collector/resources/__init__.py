@@ -2,6 +2,10 @@ import os
 import sys
 from pathlib import Path
 
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
 __all__ = [
     'RESOURCE_DIR',
     'logo_path'
@@ -17,21 +21,25 @@ def _get_base_dir() -> Path:
         Path to the base resources directory
     """
     if "NUITKA_ONEFILE_PARENT" in os.environ:
-        print("App is packaged, detecting resources directory")
-        print(f"sys.executable: {sys.executable}")
-        print(f"sys.argv: {sys.argv}")
-        print(f"cwd: {os.getcwd()}")
+        logger.debug("App is packaged, detecting resources directory")
+        logger.debug(f"sys.executable: {sys.executable}")
+        logger.debug(f"sys.argv: {sys.argv}")
+        logger.debug(f"cwd: {os.getcwd()}")
         return Path(sys.executable).parent / "resources"
     else:
-        print(f"using module's directory: {Path(__file__).parent}")
+        logger.debug(f"using module's directory: {Path(__file__).parent}")
         return Path(__file__).parent
 
 
 # Initialize resource directory with proper detection
 RESOURCE_DIR = _get_base_dir()
-print(f"Resource directory: {RESOURCE_DIR}")
+logger.debug(f"Resource directory: {RESOURCE_DIR}")
 logo_path = RESOURCE_DIR / "logo.ico"
-print(f"Logo path: {logo_path}")
+logger.debug(f"Logo path: {logo_path}")
+
+# Resource subdirectories as strings, so lookups are a plain string join
+_DETECTABLE_DIR = str(RESOURCE_DIR / "detectable")
+_REF_DIR = str(RESOURCE_DIR / "ref")
 
 # Make resources directory structure visible
 def get_detectable_image_path(image_name: str) -> str:
@@ -44,8 +52,7 @@ def get_detectable_image_path(image_name: str) -> str:
     Returns:
         Absolute path to the image as string
     """
-    path = RESOURCE_DIR / "detectable" / image_name
-    return str(path)
+    return os.path.join(_DETECTABLE_DIR, image_name)
 
 
 def get_ref_images_dir() -> str:
@@ -55,5 +62,4 @@ def get_ref_images_dir() -> str:
     Returns:
         The path to the reference images directory as string
     """
-    path = RESOURCE_DIR / 'ref'
-    return str(path)
+    return _REF_DIR
@@ -6,6 +6,7 @@ It collects lineup data for each player across 8 groups (8 players per group).
 """
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -54,6 +55,9 @@ class Tournament64PlayerCollector:
         self.controller = controller
         self.lineup_processor = lineup_processor
         self.save_dir = os.path.join(save_dir, "01_tournament_64_player")
+        # Button positions indexed by group ID and avatar positions by player index (1-8)
+        self._group_positions = {i: PROMOTION_TOURNAMENT.get_group_button_position(i) for i in range(1, 9)}
+        self._avatar_positions = {i: PROMOTION_TOURNAMENT.get_player_avatar_position(i) for i in range(1, 9)}
 
         # Ensure save directories exist
         os.makedirs(self.save_dir, exist_ok=True)
@@ -71,7 +75,7 @@ class Tournament64PlayerCollector:
         logger.info(f"Navigating to group {group_id}")
 
         # Get the position for the specified group
-        group_pos = PROMOTION_TOURNAMENT.get_group_button_position(group_id)
+        group_pos = self._group_positions[group_id]
         return self.controller.click_at_position(group_pos)
 
     def collect_player(self, group_id: int, player_index: int) -> Optional[User]:
@@ -88,7 +92,7 @@ class Tournament64PlayerCollector:
         logger.info(f"Collecting data for player {player_index} in group {group_id}")
 
         # Get player avatar position and click on it
-        avatar_pos = PROMOTION_TOURNAMENT.get_player_avatar_position(player_index)
+        avatar_pos = self._avatar_positions[player_index]
         if not self.controller.click_at_position(avatar_pos):
             logger.error(f"Failed to click on avatar for player {player_index}")
             return None
@@ -105,6 +109,13 @@ class Tournament64PlayerCollector:
         return user
 
 
+    @staticmethod
+    def _save_player(user: User, group_dir: str, player_index: int) -> None:
+        """Save a player's data and images to the group directory"""
+        user.save_as_json(os.path.join(group_dir, f"player_{player_index}.json"))
+        user.save_team_image(group_dir, f"player_{player_index}")
+        user.save_profile_image(group_dir, f"player_{player_index}")
+
     def collect_group(self, group_id: int) -> Optional[Tournament64PlayerData]:
         """
         Collect data for all players in a group.
@@ -130,17 +141,21 @@ class Tournament64PlayerCollector:
             # Initialize group data
             group_data = Tournament64PlayerData(group_id=group_id)
 
-            # Process each player in the group
-            for player_index in range(1, 9):
-                user = self.collect_player(group_id, player_index)
-
-                if user:
-                    # Add to group data
-                    group_data.players.append(user)
-
-                    user.save_as_json(os.path.join(group_dir, f"player_{player_index}.json"))
-                    user.save_team_image(group_dir, f"player_{player_index}")
-                    user.save_profile_image(group_dir, f"player_{player_index}")
+            # Process each player in the group. Saving a player's files runs in
+            # the background while the next player is being collected
+            futures = []
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for player_index in range(1, 9):
+                    user = self.collect_player(group_id, player_index)
+
+                    if user:
+                        # Add to group data
+                        group_data.players.append(user)
+                        futures.append(executor.submit(self._save_player, user, group_dir, player_index))
+
+            # Raise any error from saving
+            for future in futures:
+                future.result()
 
             json_path = os.path.join(group_dir, "data.json")
             group_data.save_as_json(json_path)
@@ -6,6 +6,7 @@ This module provides functionality to collect data from the championship tournam
 """
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -62,6 +63,9 @@ class ChampionshipTournamentCollector:
         self.detector = detector
         self.save_dir = os.path.join(save_dir, "03_tournament_championship")
         os.makedirs(self.save_dir, exist_ok=True)
+        # Match positions indexed by match ID
+        self._stage_8_4_positions = {i: CHAMPIONSHIP_TOURNAMENT.get_stage_8_4_position(i) for i in range(1, 5)}
+        self._stage_4_2_positions = {i: CHAMPIONSHIP_TOURNAMENT.get_stage_4_2_position(i) for i in range(1, 3)}
         self.battle_collector = BattleDataCollector(
             detector=detector,
             controller=controller,
@@ -75,7 +79,7 @@ class ChampionshipTournamentCollector:
         battles = []
         for i in range(1, 5):
             # Click on each match position
-            match_pos = CHAMPIONSHIP_TOURNAMENT.get_stage_8_4_position(i)
+            match_pos = self._stage_8_4_positions[i]
             self.controller.click_at_position(match_pos)
 
             # Collect battle data
@@ -90,7 +94,7 @@ class ChampionshipTournamentCollector:
         """
         battles = []
         for i in range(1, 3):
-            self.controller.click_at_position(CHAMPIONSHIP_TOURNAMENT.get_stage_4_2_position(i))
+            self.controller.click_at_position(self._stage_4_2_positions[i])
             detected = self.detector.is_image_present(CHAMPIONSHIP_TOURNAMENT.CHAMPION_BUTTON)
             if detected:
                 self.controller.click_at_position(CHAMPIONSHIP_TOURNAMENT.stage_4_2)
@@ -106,7 +110,7 @@ class ChampionshipTournamentCollector:
         """
         battles = []
         for i in range(1, 3):
-            self.controller.click_at_position(CHAMPIONSHIP_TOURNAMENT.get_stage_4_2_position(i))
+            self.controller.click_at_position(self._stage_4_2_positions[i])
             detected = self.detector.is_image_present(CHAMPIONSHIP_TOURNAMENT.CHAMPION_BUTTON)
             if not detected:
                 self.controller.click_at_position(BATTLE_RESULT.close)
@@ -153,12 +157,19 @@ class ChampionshipTournamentCollector:
                 battles=battles
             )
 
-            tournament_data.save_as_json(os.path.join(stage_dir, "data.json"))
+            # Write the stage data and the battle images concurrently
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(tournament_data.save_as_json, os.path.join(stage_dir, "data.json"))]
+                for (i, battle) in enumerate(battles):
+                    image_dir = os.path.join(stage_dir, f"battle_{i+1}.png")
+                    futures.append(executor.submit(battle.save_image, image_dir))
+
+            # Raise any error from saving
+            for future in futures:
+                future.result()
+
             logger.info(f"Saved stage data to {os.path.join(stage_dir, 'data.json')}")
-            for (i, battle) in enumerate(battles):
-                image_dir = os.path.join(stage_dir, f"battle_{i+1}.png")
-                battle.save_image(image_dir)
-                logger.info(f"Saved battle_{i+1} image to {image_dir}")
+            logger.info(f"Saved {len(battles)} battle images to {stage_dir}")
 
             return tournament_data
         except Exception as e:
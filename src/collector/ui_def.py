@@ -2,14 +2,17 @@
 UI Constants for NIKKE interfaces.
 This file defines button and UI element positions using standard coordinates (3580x2014).
 All positions are defined as classes with typed attributes to enable IDE autocompletion.
+Position and region getters are memoized, since each takes one of a few fixed indices;
+callers must not modify the returned regions.
 """
+import functools
 from dataclasses import dataclass
-from typing import NamedTuple
+from typing import Final, NamedTuple
 
 from collector.resources import get_detectable_image_path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Region:
     start_x: int
     start_y: int
@@ -52,6 +55,7 @@ class GroupSelectionElements:
     close: Position = Position(2228, 260)  # Close button (top-right)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_group_position(cls, group_number: int) -> Position:
         """
         Calculate position for any group number dynamically.
@@ -98,6 +102,7 @@ class GroupDetailElements:
     group_button: Position = Position(1790, 583)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_participant_avatar(cls, participant_index: int) -> Position:
         """
         Get the position of a participant's avatar in the current group view.
@@ -145,6 +150,7 @@ class TeamInfoElements:
     round_region: Region = Region(start_x=_CHARACTER_START_X - 5, start_y=_CHARACTER_START_Y, width=_ROUND_WIDTH,
                                   height=_ROUND_HEIGHT)
 
+    @functools.lru_cache(maxsize=None)
     def get_character_region(self, character_index: int) -> Region:
         if not 1 <= character_index <= 5:
             raise ValueError(f"Character index must be between 1 and 5, got {character_index}")
@@ -153,6 +159,7 @@ class TeamInfoElements:
         return Region(start_x=x, start_y=y, width=STANDARD_CHARACTER_WIDTH, height=STANDARD_CHARACTER_HEIGHT)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_round_button(cls, round_index: int) -> Position:
         """
         Get the position of a specific round button.
@@ -195,6 +202,7 @@ class MatchResultElements:
     close: Position = Position(2209, 490)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_play_position(cls, round_num: int) -> Position:
         if not 1 <= round_num <= 5:
             raise ValueError(f"Round number must be between 1 and 5, got {round_num}")
@@ -217,13 +225,13 @@ class LineupViewElements:
     """
     # Character slots (based on typical 5-character lineup)
     # These positions would need to be adjusted based on actual game UI
-    characters: list[Position] = [
+    characters: tuple[Position, ...] = (
         Position(358, 900),  # Character 1
         Position(501, 900),  # Character 2
         Position(644, 900),  # Character 3
         Position(787, 900),  # Character 4
         Position(930, 900),  # Character 5
-    ]
+    )
 
     # Lineup screen region for capturing the entire lineup
     lineup_area: Region = Region(300, 750, 700, 250)
@@ -274,9 +282,11 @@ class BattleResultElements:
         region=Region(start_x=2177, start_y=1840, width=280, height=160)
     )
 
+    @functools.lru_cache(maxsize=None)
     def get_total_region(self) -> Region:
         return Region(start_x=self._START_X, start_y=self._START_Y, width=self._WIDTH, height=self._HEIGHT)
 
+    @functools.lru_cache(maxsize=None)
     def get_region(self, round_num: int) -> Region:
         start_y = self._FIRST_RESULT_START_Y + (round_num - 1) * (self._RESULT_GAP + self._RESULT_HEIGHT)
         return Region(start_x=self._FIRST_RESULT_START_X, start_y=start_y, width=self._RESULT_WIDTH,
@@ -311,6 +321,7 @@ class PromotionTournament:
     )
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_group_button_position(cls, group_number: int) -> Position:
         """
         Calculate position for any group number dynamically.
@@ -334,6 +345,7 @@ class PromotionTournament:
     _STAGE_64_32_WIDTH = 284
     _STAGE_64_32_HEIGHT = 736
 
+    @functools.lru_cache(maxsize=None)
     def get_stage_64_32_position(self, battle_id: int) -> Position:
         if not 1 <= battle_id <= 4:
             raise ValueError(f"Group number must be between 1 and 8, got {battle_id}")
@@ -346,6 +358,7 @@ class PromotionTournament:
         return Position(x, y)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_stage_32_16_position(index: int) -> Position:
         if not 1 <= index <= 2:
             raise ValueError(f"Group number must be between 1 and 2, got {index}")
@@ -365,7 +378,15 @@ class PromotionTournament:
     _AVATAR_COLUMN_SPACING = 907
     _AVATAR_ROW_SPACING_SMALL = 255
     _AVATAR_ROW_SPACING_LARGE = 489
+    # Vertical offset of each avatar row from the first one
+    _AVATAR_ROW_OFFSETS = (
+        0,
+        _AVATAR_ROW_SPACING_SMALL,
+        _AVATAR_ROW_SPACING_SMALL + _AVATAR_ROW_SPACING_LARGE,
+        2 * _AVATAR_ROW_SPACING_SMALL + _AVATAR_ROW_SPACING_LARGE,
+    )
 
+    @functools.lru_cache(maxsize=None)
     def get_player_avatar_position(self, index: int) -> Position:
         """
         Get screen position of player avatar boxes.
@@ -383,29 +404,10 @@ class PromotionTournament:
         if not 1 <= index <= 8:
             raise ValueError(f"Avatar index must be between 1 and 8, got {index}")
 
-        # Calculate vertical position (row)
-        row = (index - 1) // 2
-
-        # Calculate horizontal position (column)
-        # If even, it's on the right side; if odd, it's on the left
-        is_right_column = (index % 2 == 0)
-
-        # Start with base coordinates
-        x = self._FIRST_AVATAR_START_X
-        y = self._FIRST_AVATAR_START_Y
-
-        # Adjust x-coordinate for right column
-        if is_right_column:
-            x += self._AVATAR_COLUMN_SPACING
-
-        # Adjust y-coordinate based on row
-        if row >= 1:
-            y += self._AVATAR_ROW_SPACING_SMALL
-        if row >= 2:  # Bottom row
-            y += self._AVATAR_ROW_SPACING_LARGE
-        if row >= 3:
-            y += self._AVATAR_ROW_SPACING_SMALL
-
+        # Odd indices are in the left column, even ones in the right column
+        row, column = divmod(index - 1, 2)
+        x = self._FIRST_AVATAR_START_X + column * self._AVATAR_COLUMN_SPACING
+        y = self._FIRST_AVATAR_START_Y + self._AVATAR_ROW_OFFSETS[row]
         return Position(x, y)
 
 
@@ -430,6 +432,7 @@ class ChampionshipTournament:
         region=Region(start_x=1477, start_y=1580, width=130, height=72)
     )
 
+    @functools.lru_cache(maxsize=None)
     def get_stage_8_4_position(self, index: int) -> Position:
         """Get position for a match in the 8->4 stage"""
         if not 1 <= index <= 4:
@@ -443,6 +446,7 @@ class ChampionshipTournament:
             y = self._STAGE_8_4_START_Y + self._STAGE_8_4_HEIGHT
         return Position(x, y)
 
+    @functools.lru_cache(maxsize=None)
     def get_stage_4_2_position(self, index: int) -> Position:
         """Get position for a match in the 4->2 stage"""
         if not 1 <= index <= 2:
@@ -454,17 +458,17 @@ class ChampionshipTournament:
             return Position(self._STAGE_4_2_B_START_X, self._STAGE_4_2_B_START_Y)
 
 
-# Add these to the module exports
-PROMOTION_TOURNAMENT = PromotionTournament()
-CHAMPIONSHIP_TOURNAMENT = ChampionshipTournament()
-GROUP_SELECTION = GroupSelectionElements()
-GROUP_DETAIL = GroupDetailElements()
-TEAM_INFO = TeamInfoElements()
-PROFILE = ProfileElements()
-CHEER = CheerElements()
-BATTLE = BattleElements()
-LINEUP = LineupViewElements()
-BATTLE_RESULT = BattleResultElements()
+# Shared screen definitions; the classes are not meant to be instantiated again
+PROMOTION_TOURNAMENT: Final[PromotionTournament] = PromotionTournament()
+CHAMPIONSHIP_TOURNAMENT: Final[ChampionshipTournament] = ChampionshipTournament()
+GROUP_SELECTION: Final[GroupSelectionElements] = GroupSelectionElements()
+GROUP_DETAIL: Final[GroupDetailElements] = GroupDetailElements()
+TEAM_INFO: Final[TeamInfoElements] = TeamInfoElements()
+PROFILE: Final[ProfileElements] = ProfileElements()
+CHEER: Final[CheerElements] = CheerElements()
+BATTLE: Final[BattleElements] = BattleElements()
+LINEUP: Final[LineupViewElements] = LineupViewElements()
+BATTLE_RESULT: Final[BattleResultElements] = BattleResultElements()
 
 # Standard window dimensions for NIKKE
 STANDARD_WINDOW_WIDTH = 3580
@@ -1,22 +1,48 @@
 import os
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, field
 from typing import Optional
 
-import mss.tools
+import cv2
+import mss
+import numpy as np
 from PIL.Image import Image, frombytes
 from mss.screenshot import ScreenShot
 
 from collector.ui_def import Region
+from .file_utils import ensure_dir
 from .logging_config import get_logger
+from .window_info import WindowInfo
 from .window_manager import WindowManager
 
 logger = get_logger(__name__)
 
 
-@dataclass
+def _png_level() -> int:
+    """
+    PNG compression level for saved captures, from NIKKE_PNG_LEVEL (0-9).
+
+    Defaults to 1: saved captures are debug dumps, where a fast save matters
+    more than a somewhat smaller file.
+    """
+    try:
+        return min(max(int(os.environ.get('NIKKE_PNG_LEVEL', '1')), 0), 9)
+    except ValueError:
+        logger.warning(f"Ignoring invalid NIKKE_PNG_LEVEL value: {os.environ['NIKKE_PNG_LEVEL']}")
+        return 1
+
+
+SAVE_PNG_LEVEL = _png_level()
+
+
+@dataclass(slots=True)
 class CaptureResult:
     screenshot: ScreenShot
     region: Region
+    # Window the region was scaled against; set for region captures
+    window_info: Optional[WindowInfo] = None
+    # BGR conversion, made on first use
+    _cv: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def width(self)->int:
@@ -27,28 +53,67 @@ class CaptureResult:
         return self.region.height
 
     def save(self, filename: str):
-        os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else '.', exist_ok=True)
-        mss.tools.to_png(self.screenshot.rgb, self.screenshot.size, output=filename)
+        ensure_dir(os.path.dirname(filename) or '.')
+        # Encode in memory and write ourselves; cv2.imwrite fails on non-ASCII paths on Windows
+        ok, data = cv2.imencode('.png', self.to_cv(), [cv2.IMWRITE_PNG_COMPRESSION, SAVE_PNG_LEVEL])
+        if not ok:
+            raise ValueError(f"Failed to encode capture for {filename}")
+        with open(filename, 'wb') as f:
+            f.write(data)
 
     def to_pil(self) -> Image:
         return frombytes("RGB", self.screenshot.size, self.screenshot.bgra, "raw", "BGRX")
 
+    def to_cv(self) -> np.ndarray:
+        """
+        Return the capture as an OpenCV (BGR) image without going through PIL.
+
+        The conversion is done once and the same array is returned to every
+        caller, so callers must not modify it.
+        """
+        if self._cv is None:
+            width, height = self.screenshot.size
+            bgra = np.frombuffer(self.screenshot.bgra, dtype=np.uint8).reshape(height, width, 4)
+            # cvtColor drops the padding channel much faster than a NumPy slice copy
+            self._cv = cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
+        return self._cv
+
+    def crop(self, region: Region) -> np.ndarray:
+        """
+        Cut a sub-region out of this capture instead of grabbing it separately.
+
+        The pixels match what capture_region would grab for the same region
+        while the window stays put.
+
+        Args:
+            region: Region in standard coordinates, within this capture's region
+
+        Returns:
+            BGR view into to_cv(); callers must not modify it
+        """
+        if self.window_info is None:
+            raise ValueError("Capture has no window info to scale the region with")
+        left, top, width, height = self.window_info.get_screen_rect(region)
+        frame_left, frame_top, _, _ = self.window_info.get_screen_rect(self.region)
+        left -= frame_left
+        top -= frame_top
+        return self.to_cv()[max(top, 0):top + height, max(left, 0):left + width]
+
 
 class WindowCapturer:
     def __init__(self, window_manager: WindowManager):
         self.sct = mss.mss()
         self.window_manager = window_manager
+        # Closes the mss instance on close() or, failing that, when collected
+        self._finalizer = weakref.finalize(self, self.sct.close)
+        # Area passed to mss, refilled for each grab; captures never overlap
+        self._monitor = {"top": 0, "left": 0, "width": 0, "height": 0}
 
     def capture_window(self) -> Optional[CaptureResult]:
         try:
             rect = self.window_manager.rect
             # Convert to mss format (left, top, width, height)
-            screenshot = self.sct.grab({
-                "top": rect.top,
-                "left": rect.left,
-                "width": rect.width,
-                "height": rect.height,
-            })
+            screenshot = self._grab(rect.left, rect.top, rect.width, rect.height)
             result = CaptureResult(screenshot=screenshot, region=Region(0, 0, rect.width, rect.height))
             return result
 
@@ -58,29 +123,34 @@ class WindowCapturer:
 
     def capture_region(self, region: Region) -> Optional[CaptureResult]:
         try:
-            # Calculate the scaled coordinates based on current window size
-            scaled_x, scaled_y = self.window_manager.get_window_info().get_scaled_position(region.start_x,
-                                                                                           region.start_y)
-            scaled_width = int(region.width * self.window_manager.get_window_info().width_ratio)
-            scaled_height = int(region.height * self.window_manager.get_window_info().height_ratio)
-
-            # Calculate absolute screen coordinates
-            abs_x = self.window_manager.get_window_info().left + scaled_x
-            abs_y = self.window_manager.get_window_info().top + scaled_y
-
-            screenshot = self.sct.grab({
-                "top": abs_y,
-                "left": abs_x,
-                "width": scaled_width,
-                "height": scaled_height
-            })
-            result = CaptureResult(screenshot=screenshot, region=region)
+            # Look the window up once; each lookup enumerates windows. The
+            # absolute screen rectangle is cached while the window stays put
+            window_info = self.window_manager.get_window_info()
+            abs_x, abs_y, scaled_width, scaled_height = window_info.get_screen_rect(region)
+
+            screenshot = self._grab(abs_x, abs_y, scaled_width, scaled_height)
+            result = CaptureResult(screenshot=screenshot, region=region, window_info=window_info)
             return result
 
         except Exception as e:
             logger.error(f"Error capturing region: {e}")
             return None
 
-    def __del__(self):
-        """Cleanup mss instance."""
-        self.sct.close()
+    def _grab(self, left: int, top: int, width: int, height: int) -> ScreenShot:
+        """Grab a screen area given in absolute screen coordinates"""
+        monitor = self._monitor
+        monitor["top"] = top
+        monitor["left"] = left
+        monitor["width"] = width
+        monitor["height"] = height
+        return self.sct.grab(monitor)
+
+    def close(self):
+        """Release the mss instance; safe to call more than once."""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Dict, Tuple
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Region:
     left: int
     top: int
@@ -19,8 +19,12 @@ class WindowInfo:
         self.left, self.top, self.right, self.bottom = rect.left, rect.top, rect.right, rect.bottom
         self.width = self.right - self.left
         self.height = self.bottom - self.top
+        self.standard_width = standard_width
+        self.standard_height = standard_height
         self.width_ratio = self.width / standard_width
         self.height_ratio = self.height / standard_height
+        # Screen rectangles of standard-coordinate regions, see get_screen_rect
+        self._screen_rects: Dict[object, Tuple[int, int, int, int]] = {}
 
     def get_scaled_position(self, standard_x: int, standard_y: int) -> Tuple[int, int]:
         """
@@ -33,8 +37,9 @@ class WindowInfo:
         Returns:
             Tuple[int, int]: Scaled (x, y) coordinates for the current window
         """
-        scaled_x = int(standard_x * self.width_ratio)
-        scaled_y = int(standard_y * self.height_ratio)
+        # Exact integer scaling; a float ratio can land one pixel short
+        scaled_x = standard_x * self.width // self.standard_width
+        scaled_y = standard_y * self.height // self.standard_height
         return scaled_x, scaled_y
 
     def get_absolute_position(self, standard_x: int, standard_y: int) -> Tuple[int, int]:
@@ -53,6 +58,28 @@ class WindowInfo:
         abs_y = self.top + scaled_y
         return abs_x, abs_y
 
+    def get_screen_rect(self, region) -> Tuple[int, int, int, int]:
+        """
+        Convert a region from standard coordinates to an absolute screen rectangle
+
+        Results are cached per region for the lifetime of this window info.
+
+        Args:
+            region: Region in standard window size (3580x2014), with start_x,
+                start_y, width and height; must be hashable
+
+        Returns:
+            Tuple[int, int, int, int]: Absolute screen (left, top, width, height)
+        """
+        screen_rect = self._screen_rects.get(region)
+        if screen_rect is None:
+            abs_x, abs_y = self.get_absolute_position(region.start_x, region.start_y)
+            screen_rect = (abs_x, abs_y,
+                           region.width * self.width // self.standard_width,
+                           region.height * self.height // self.standard_height)
+            self._screen_rects[region] = screen_rect
+        return screen_rect
+
     def __str__(self) -> str:
         return (f"Window: {self.left},{self.top} - {self.right},{self.bottom} "
                 f"(Size: {self.width}x{self.height}) "
@@ -42,6 +42,7 @@ class WindowManager:
             self.standard_width = STANDARD_WINDOW_WIDTH
             self.standard_height = STANDARD_WINDOW_HEIGHT
         self.exact_match = exact_match
+        self._window_info: Optional[WindowInfo] = None
         self._update_window_info()
 
     def _update_window_info(self):
@@ -51,7 +52,10 @@ class WindowManager:
         rect = get_window_rect(hwnd)
         if not rect:
             raise Exception("Failed to get window rect")
-        self._window_info = WindowInfo(hwnd, rect, self.standard_width, self.standard_height)
+        # Keep the current info, and what it has cached, while the window stays put
+        window_info = self._window_info
+        if window_info is None or window_info.hwnd != hwnd or window_info.rect != rect:
+            self._window_info = WindowInfo(hwnd, rect, self.standard_width, self.standard_height)
 
     def get_window_info(self) -> WindowInfo:
         self._update_window_info()
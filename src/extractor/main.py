@@ -14,6 +14,8 @@ import qdarktheme
 from PySide6.QtGui import QGuiApplication, Qt
 from PySide6.QtWidgets import QApplication
 
+from collector.image_processor import configure_opencv
+from collector.logging_config import configure_logging
 from collector.ui_def import STANDARD_WINDOW_WIDTH
 from collector.window_manager import WindowManager
 from extractor.app_config import AppConfigManager
@@ -23,6 +25,8 @@ QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundin
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    configure_logging(include_file_info=False)
+    configure_opencv()
     qdarktheme.setup_theme('dark')
     config_manager = AppConfigManager()
     window_manager = WindowManager("nikke.exe")
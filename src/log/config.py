@@ -7,6 +7,10 @@ import logging
 import os
 import sys
 
+# Source file logging uses to find the caller of a log call, saved so caller
+# lookup can be switched back on after being disabled
+_LOGGING_SRCFILE = logging._srcfile
+
 
 def configure_logging(
         level=logging.INFO,
@@ -19,13 +23,16 @@ def configure_logging(
     Args:
         level: Logging level (default: INFO)
         log_file: Optional path to log file
-        include_file_info: Whether to include file info in log messages
+        include_file_info: Whether to include file info in log messages. Only
+            applied at DEBUG level, since looking up the caller costs a stack
+            walk for every record
 
     Returns:
         The configured root logger
     """
     # Create formatter
-    if include_file_info:
+    detailed = include_file_info and level <= logging.DEBUG
+    if detailed:
         # Detailed format: includes timestamp, level, filename, line number and function name
         log_format = '%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d - %(funcName)s] - %(message)s'
     else:
@@ -53,6 +60,12 @@ def configure_logging(
         file_handler.setFormatter(formatter)
         handlers.append(file_handler)
 
+    # Don't collect record fields the format does not use
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = _LOGGING_SRCFILE if detailed else None
+
     # Configure root logger
     logging.basicConfig(
         level=level,
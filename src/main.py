@@ -22,6 +22,7 @@ from admin_helper import is_admin
 from collector.character_matcher import CharacterMatcher
 from collector.delay_manager import DelayManager
 from collector.image_detector import ImageDetector
+from collector.image_processor import configure_opencv
 from collector.lineup_processor import LineupProcessor
 from collector.logging_config import configure_logging
 from collector.models import TournamentStage
@@ -44,6 +45,7 @@ from ui.time_warning_dialog import TimeWarningDialog
 APP_CONFIG = AppConfigManager()
 log_file = os.path.join(APP_CONFIG.log_dir, "nikke_data_collector.log")
 logger = configure_logging(log_file=log_file, include_file_info=True)
+configure_opencv()
 
 
 class MainWindow(QMainWindow):
@@ -18,6 +18,9 @@ class JSONSerializableMixin:
     Can be used with any class that implements the to_json method (e.g., JSONWizard).
     """
 
+    # No instance state, so slotted subclasses don't get a __dict__
+    __slots__ = ()
+
     def save_as_json(self, filename: str) -> None:
         """
         Save the object to a JSON file.
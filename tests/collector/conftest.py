@@ -29,8 +29,8 @@ def delay_manager() -> DelayManager:
 
 @pytest.fixture
 def capturer(manager) -> WindowCapturer:
-    capturer = WindowCapturer(manager)
-    return capturer
+    with WindowCapturer(manager) as capturer:
+        yield capturer
 
 
 @pytest.fixture
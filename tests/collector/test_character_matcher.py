@@ -2,7 +2,11 @@ import logging
 from dataclasses import dataclass
 from typing import List
 
+import numpy as np
+
 from collector.character_matcher import CharacterMatcher
+from collector.image_processor import ImageProcessor
+from domain.character import Character
 
 logger = logging.getLogger(__name__)
 
@@ -32,3 +36,67 @@ def test_character_matcher(matcher: CharacterMatcher):
 def test_character_matcher_populate_db(matcher: CharacterMatcher):
     matcher.populate_from_image_directory("testdata/ref")
 
+
+class StubCharacterDAO:
+    """In-memory stand-in for CharacterDAO holding one image per character"""
+
+    def __init__(self, images):
+        self.characters = [Character(id=f"{i:03d}") for i in range(len(images))]
+        self.blobs = {c.id: ImageProcessor.image_to_blob(image) for c, image in zip(self.characters, images)}
+
+    def get_all_characters(self):
+        return self.characters
+
+    def get_character_images(self, character_id):
+        return [(1, self.blobs[character_id])]
+
+
+def _references():
+    rng = np.random.default_rng(0)
+    # Two image shapes, so references fall into two groups
+    return [rng.integers(0, 256, shape, dtype=np.uint8) for shape in [(80, 60)] * 3 + [(100, 60)] * 3]
+
+
+def test_recent_reference_skips_full_scan(tmp_path, monkeypatch):
+    references = _references()
+    matcher = CharacterMatcher(str(tmp_path), StubCharacterDAO(references), similarity_threshold=0.9)
+    calls = []
+    match_batch = ImageProcessor.match_batch
+    monkeypatch.setattr(ImageProcessor, "match_batch",
+                        staticmethod(lambda *args: calls.append(args) or match_batch(*args)))
+
+    character, similarity = matcher.find_best_match(references[1])
+    assert character.id == "001" and similarity > 0.99
+    assert calls
+    assert list(matcher._ref_order) == [(0, 1)]
+
+    # The recently matched reference clears the threshold, so no group is scanned
+    calls.clear()
+    character, _ = matcher.find_best_match(references[1])
+    assert character.id == "001"
+    assert not calls
+    matcher.cache.close()
+
+
+def test_touch_reference_order_and_cap(tmp_path):
+    matcher = CharacterMatcher(str(tmp_path), StubCharacterDAO([]), similarity_threshold=0.9)
+    for row in range(matcher._ref_order_max + 4):
+        matcher._touch_reference(0, row)
+    assert len(matcher._ref_order) == matcher._ref_order_max
+    assert next(iter(matcher._ref_order)) == (0, matcher._ref_order_max + 3)
+    assert (0, 0) not in matcher._ref_order
+
+    # Touching a known reference moves it to the front
+    matcher._touch_reference(0, 10)
+    assert next(iter(matcher._ref_order)) == (0, 10)
+    assert len(matcher._ref_order) == matcher._ref_order_max
+
+    matcher.clear_cache()
+    assert not matcher._ref_order
+    matcher.cache.close()
+
+
+def test_no_reference_with_non_positive_threshold(tmp_path):
+    matcher = CharacterMatcher(str(tmp_path), StubCharacterDAO([]), similarity_threshold=0.0)
+    assert matcher.find_best_match(np.zeros((80, 60), dtype=np.uint8)) == (None, 0.0)
+    matcher.cache.close()
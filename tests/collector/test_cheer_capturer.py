@@ -9,7 +9,7 @@ from tests.collector.utils import keyboard_terminable
 def test_cheer_capturer(controller, lineup_processor):
     cheer_capturer = CheerCapturer(lineup_processor, controller)
     cheer_result = cheer_capturer.process()
-    images = [cheer_result.left_user.team_image, cheer_result.right_user.team_image]
+    images = [cheer_result.left_user.team_image.pil, cheer_result.right_user.team_image.pil]
     final_images = combine_images(60, 80, images)
     save_dir = "testdata/cheer_capturer"
     os.makedirs(save_dir, exist_ok=True)
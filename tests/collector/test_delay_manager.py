@@ -0,0 +1,25 @@
+import time
+
+from collector.delay_manager import DelayManager
+
+
+def test_wait_without_pending_delay():
+    assert DelayManager(0.1, 0.2).wait() == 0.0
+
+
+def test_wait_covers_the_rest_of_the_delay():
+    manager = DelayManager(0.2, 0.2)
+    start = time.monotonic()
+    deadline = manager.begin_delay()
+    assert abs(deadline - start - 0.2) < 0.05
+    time.sleep(0.05)
+    slept = manager.wait()
+    assert 0 < slept <= 0.15 + 0.01
+    assert time.monotonic() >= deadline
+
+
+def test_wait_after_delay_elapsed():
+    manager = DelayManager(0.01, 0.01)
+    manager.begin_delay()
+    time.sleep(0.05)
+    assert manager.wait() == 0.0
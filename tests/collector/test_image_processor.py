@@ -0,0 +1,56 @@
+import numpy as np
+
+from collector.image_processor import ImageProcessor
+
+
+def _random_images(count, shape, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, (count, *shape), dtype=np.uint8)
+
+
+def test_normalize_templates_rows():
+    templates = _random_images(4, (12, 10))
+    templates[3] = 77  # flat template
+    rows = ImageProcessor.normalize_templates(templates)
+    assert rows.shape == (4, 120)
+    assert np.allclose(rows[:3].mean(axis=1), 0, atol=1e-6)
+    assert np.allclose(np.linalg.norm(rows[:3], axis=1), 1, atol=1e-5)
+    assert not rows[3].any()
+
+
+def test_match_batch_agrees_with_per_template_matching():
+    templates = _random_images(6, (117, 80))
+    prepared = ImageProcessor.normalize_templates(templates)
+    # Same size as the templates, and twice the size as captured at a larger scale
+    for query in (_random_images(1, (117, 80), seed=1)[0], _random_images(1, (234, 160), seed=2)[0]):
+        batched = ImageProcessor.match_batch(query, prepared, (117, 80))
+        expected = [ImageProcessor.match_with_template(query, template) for template in templates]
+        assert np.allclose(batched, expected, atol=1e-4)
+
+
+def test_match_batch_finds_the_query_among_templates():
+    templates = _random_images(5, (60, 40))
+    prepared = ImageProcessor.normalize_templates(templates)
+    similarities = ImageProcessor.match_batch(templates[2], prepared, (60, 40))
+    assert int(np.argmax(similarities)) == 2
+    assert similarities[2] > 0.999
+
+
+def test_prepare_query_keeps_aspect_ratio():
+    # A square query against tall templates is cropped, not stretched
+    query = np.zeros((100, 100), dtype=np.uint8)
+    query[:, 40:60] = 255
+    vector = ImageProcessor.prepare_query(query, (100, 50))
+    expected = ImageProcessor.normalize_templates(query[np.newaxis, :, 25:75])[0]
+    assert np.allclose(vector, expected, atol=1e-5)
+
+
+def test_dhash_of_gradients():
+    rising = np.tile(np.arange(0, 256, 4, dtype=np.uint8), (64, 1))
+    assert ImageProcessor.compute_image_hash(rising) == 2 ** 64 - 1
+    assert ImageProcessor.compute_image_hash(rising[:, ::-1].copy()) == 0
+
+
+def test_dhash_batch_matches_single():
+    images = list(_random_images(3, (50, 70, 3)))
+    assert ImageProcessor.compute_image_hashes(images) == [ImageProcessor.compute_image_hash(i) for i in images]
@@ -0,0 +1,32 @@
+import io
+
+import numpy as np
+from PIL import Image
+
+from collector.lazy_image import LazyImage
+
+
+def test_from_cv_image():
+    rng = np.random.default_rng(0)
+    bgr = rng.integers(0, 256, (30, 40, 3), dtype=np.uint8)
+    image = LazyImage(bgr)
+    assert image.size == (40, 30)
+    assert np.array_equal(np.asarray(image.pil), bgr[:, :, ::-1])
+
+
+def test_from_pil_keeps_alpha():
+    rgba = Image.new("RGBA", (8, 6), (10, 20, 30, 40))
+    image = LazyImage(rgba)
+    assert image.pil.mode == "RGBA"
+    assert image.pil.getpixel((0, 0)) == (10, 20, 30, 40)
+
+
+def test_from_bytes_and_save(tmp_path):
+    buffer = io.BytesIO()
+    Image.new("RGB", (5, 7), (1, 2, 3)).save(buffer, format="PNG")
+    image = LazyImage(buffer.getvalue())
+    assert image.size == (5, 7)
+
+    path = tmp_path / "image.png"
+    image.save(str(path))
+    assert path.read_bytes() == image.to_bytes()
@@ -0,0 +1,19 @@
+import pytest
+
+from collector.ui_def import PROMOTION_TOURNAMENT, Position
+
+
+def test_player_avatar_positions():
+    expected = [
+        Position(1335, 700), Position(2242, 700),
+        Position(1335, 955), Position(2242, 955),
+        Position(1335, 1444), Position(2242, 1444),
+        Position(1335, 1699), Position(2242, 1699),
+    ]
+    assert [PROMOTION_TOURNAMENT.get_player_avatar_position(i) for i in range(1, 9)] == expected
+
+
+@pytest.mark.parametrize("index", [0, 9])
+def test_player_avatar_index_out_of_range(index):
+    with pytest.raises(ValueError):
+        PROMOTION_TOURNAMENT.get_player_avatar_position(index)
@@ -0,0 +1,28 @@
+from fractions import Fraction
+
+from collector.ui_def import Region as StandardRegion
+from collector.window_info import Region, WindowInfo
+
+
+def _window_info(left, top, width, height):
+    return WindowInfo(1, Region(left, top, left + width, top + height, width, height), 3580, 2014)
+
+
+def test_scaled_position_is_exact():
+    for width, height in ((3580, 2014), (1790, 1007), (2561, 1441), (1500, 844)):
+        info = _window_info(0, 0, width, height)
+        for x, y in ((0, 0), (1, 1), (1466, 437), (3579, 2013), (2035, 1620)):
+            assert info.get_scaled_position(x, y) == (
+                int(Fraction(x * width, 3580)), int(Fraction(y * height, 2014)))
+
+
+def test_standard_size_is_identity():
+    info = _window_info(0, 0, 3580, 2014)
+    assert info.get_scaled_position(1234, 567) == (1234, 567)
+
+
+def test_screen_rect():
+    info = _window_info(37, 11, 1790, 1007)
+    region = StandardRegion(start_x=1342, start_y=1060, width=896, height=356)
+    assert info.get_screen_rect(region) == (37 + 671, 11 + 530, 448, 178)
+    assert info.get_screen_rect(region) is info.get_screen_rect(region)